@@ -15,6 +15,7 @@ from flask import (
 from flask_caching import Cache
 from datetime import datetime, timedelta, date
 import os
+import re
 from typing import List, Optional, Tuple
 from werkzeug.security import check_password_hash, generate_password_hash
 import pytz
@@ -340,21 +341,28 @@ def inject_sports_helpers():
         'get_matchup_data': get_matchup_data,
     }
 
+# Date fragments stripped from calendar invite titles, applied in order
+# Patterns like "Nov 3 - ", "11/3 - ", "2025-11-03 - ", etc.
+_CALENDAR_TITLE_DATE_RES = tuple(re.compile(pattern) for pattern in (
+    r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s*[-–—]\s*',  # Date - prefix
+    r'\d{4}-\d{2}-\d{2}\s*[-–—]\s*',  # ISO date - prefix
+    r'[A-Z][a-z]{2}\s+\d{1,2},?\s+\d{4}\s*[-–—]\s*',  # "Nov 3, 2025 - " prefix
+    r'[A-Z][a-z]{2}\s+\d{1,2}\s*[-–—]\s*',  # "Nov 3 - " prefix
+    r'\s*[-–—]\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$',  # - Date suffix
+    r'\s*[-–—]\s*\d{4}-\d{2}-\d{2}$',  # - ISO date suffix
+    r'\s*[-–—]\s*[A-Z][a-z]{2}\s+\d{1,2},?\s+\d{4}$',  # - "Nov 3, 2025" suffix
+))
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEADING_DASH_RE = re.compile(r'^\s*[-–—]\s*')
+
 def clean_calendar_title(title):
     """Remove date patterns from event title for calendar invites"""
-    import re
     # Remove common date patterns that might be in titles
-    # Patterns like "Nov 3 - ", "11/3 - ", "2025-11-03 - ", etc.
-    title = re.sub(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s*[-–—]\s*', '', title)  # Date - prefix
-    title = re.sub(r'\d{4}-\d{2}-\d{2}\s*[-–—]\s*', '', title)  # ISO date - prefix
-    title = re.sub(r'[A-Z][a-z]{2}\s+\d{1,2},?\s+\d{4}\s*[-–—]\s*', '', title)  # "Nov 3, 2025 - " prefix
-    title = re.sub(r'[A-Z][a-z]{2}\s+\d{1,2}\s*[-–—]\s*', '', title)  # "Nov 3 - " prefix
-    title = re.sub(r'\s*[-–—]\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$', '', title)  # - Date suffix
-    title = re.sub(r'\s*[-–—]\s*\d{4}-\d{2}-\d{2}$', '', title)  # - ISO date suffix
-    title = re.sub(r'\s*[-–—]\s*[A-Z][a-z]{2}\s+\d{1,2},?\s+\d{4}$', '', title)  # - "Nov 3, 2025" suffix
+    for pattern in _CALENDAR_TITLE_DATE_RES:
+        title = pattern.sub('', title)
     # Clean up any double spaces or leading/trailing dashes
-    title = re.sub(r'\s+', ' ', title).strip()
-    title = re.sub(r'^\s*[-–—]\s*', '', title).strip()
+    title = _WHITESPACE_RE.sub(' ', title).strip()
+    title = _LEADING_DASH_RE.sub('', title).strip()
     return title
 
 @app.template_filter('google_calendar_link')
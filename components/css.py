@@ -54,6 +54,13 @@ BANDSINTOWN_CSS = """
     font-size: 1rem;
 }
 
+/* Event grid - three cards per row */
+.event-grid {
+    display: grid;
+    grid-template-columns: repeat(3, 1fr);
+    gap: 16px;
+}
+
 /* Event cards - smaller, condensed like Bandsintown */
 .event-card {
     background: white;
@@ -118,6 +125,31 @@ BANDSINTOWN_CSS = """
     margin-top: 0.5rem;
 }
 
+/* Tickets/Details link styled as a full-width button */
+.event-button {
+    display: block;
+    text-align: center;
+    margin-top: 0.75rem;
+    padding: 0.5rem 1rem;
+    border-radius: 6px;
+    font-weight: 600;
+    background: #FF3B5C;
+    color: white !important;
+    text-decoration: none !important;
+}
+.event-button.disabled {
+    background: #e9ecef;
+    color: #6C757D !important;
+    cursor: default;
+}
+
+.event-debug {
+    font-size: 0.75rem;
+    color: #856404;
+    background: #fff3cd;
+    padding: 0.25rem 0.5rem;
+}
+
 .calendar-icon {
     display: inline-block;
     width: 14px;
@@ -177,6 +209,9 @@ BANDSINTOWN_CSS = """
 
 /* Stats section */
 .stats-section {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 1rem;
     background: white;
     padding: 1.25rem;
     border-radius: 8px;
@@ -215,6 +250,10 @@ div[data-testid="stButton"] button {
         grid-template-columns: 1fr;
     }
 
+    .stats-section {
+        grid-template-columns: repeat(2, 1fr);
+    }
+
     .hero h1 {
         font-size: 1.5rem;
     }
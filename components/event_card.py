@@ -2,98 +2,152 @@
 Event card rendering components
 """
 
+import base64
+import html
 import io
 import streamlit as st
+from PIL import Image
 from dateutil import parser as dtp
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, Iterable, Optional, Tuple
 from utils.image_processing import get_event_image
 
+PLACEHOLDER_IMAGE = "https://placehold.co/400x250/f8f9fa/6C757D?text=Event"
+# Generated images above this size are re-encoded at card size before being inlined
+MAX_INLINE_IMAGE_BYTES = 150_000
+# Total inlined image bytes per grid; later cards fall back to the placeholder image
+MAX_INLINE_GRID_BYTES = 3_000_000
+CARD_IMAGE_SIZE = (400, 250)
+CALENDAR_SVG = '<svg class="calendar-icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="3" y="4" width="18" height="18" rx="2" ry="2"></rect><line x1="16" y1="2" x2="16" y2="6"></line><line x1="8" y1="2" x2="8" y2="6"></line><line x1="3" y1="10" x2="21" y2="10"></line></svg>'
+
+
+def _event_start(event: Dict[str, Any]) -> Optional[datetime]:
+    """Start datetime, preferring the one parsed once at load time ('_start_dt')"""
+    if "_start_dt" in event:
+        return event["_start_dt"]
+    try:
+        return dtp.parse(event["start_iso"])
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return None
+
 
 def render_event_card(event: Dict[str, Any], debug_mode: bool = False) -> None:
     """Render a single event card in Bandsintown style."""
-    with st.container():
-        st.markdown('<div class="event-card">', unsafe_allow_html=True)
-        
-        # Event image
-        _img, error = get_event_image(event)
-        if error:
-            if debug_mode:
-                st.warning(f"Image error: {error}")
-            # Use placeholder if image generation failed
-            _img = "https://placehold.co/400x250/f8f9fa/6C757D?text=Event"
-        
-        # Render image (handle both URL strings and BytesIO buffers)
-        if _img:
-            try:
-                if isinstance(_img, io.BytesIO):
-                    _img.seek(0)
-                    # Let Streamlit auto-size to container (default behavior)
-                    st.image(_img)
-                else:
-                    # Let Streamlit auto-size to container (default behavior)
-                    st.image(_img)
-            except Exception as e:
-                if debug_mode:
-                    st.error(f"Failed to load image: {e}")
-                # Fallback to HTML img tag
-                if isinstance(_img, str):
-                    st.markdown(f'<img src="{_img}" class="event-image" alt="Event image" />', unsafe_allow_html=True)
-                else:
-                    st.markdown('<div class="event-image"></div>', unsafe_allow_html=True)
-        else:
-            # No image available
-            st.markdown('<div class="event-image"></div>', unsafe_allow_html=True)
-        
-        # Card content
-        st.markdown('<div style="padding: 0.75rem;">', unsafe_allow_html=True)
-        
-        # Format date
+    st.markdown(render_event_card_html(event, debug_mode=debug_mode), unsafe_allow_html=True)
+
+
+def _image_data_uri(buffer: io.BytesIO, limit: int = MAX_INLINE_IMAGE_BYTES) -> Tuple[Optional[str], int]:
+    """
+    Inline a generated image as a data URI, returning (uri, image bytes)
+    Images over `limit` are shrunk to card size as JPEG first, so one card can't bloat the
+    grid's single markdown block; the uri is None if the image still doesn't fit.
+    """
+    if limit <= 0:
+        return None, 0
+    data = buffer.getvalue()
+    mime = "image/png"
+    if len(data) > limit:
         try:
-            event_date = dtp.parse(event["start_iso"]).strftime("%a, %b %d")
-            event_time = dtp.parse(event["start_iso"]).strftime("%I:%M %p")
-        except:
-            event_date = "TBA"
-            event_time = ""
-        
-        # Date with calendar icon
-        date_display = event_date.upper() if event_date != "TBA" else "TBA"
-        calendar_svg = '<svg class="calendar-icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="3" y="4" width="18" height="18" rx="2" ry="2"></rect><line x1="16" y1="2" x2="16" y2="6"></line><line x1="8" y1="2" x2="8" y2="6"></line><line x1="3" y1="10" x2="21" y2="10"></line></svg>'
-        st.markdown(f'<div class="event-date-pill">{calendar_svg} {date_display} {event_time}</div>', unsafe_allow_html=True)
-        
-        # Title as link
-        title = event.get("title") or "Event"
-        link = event.get("link")
-        if link:
-            st.markdown(f'<a href="{link}" style="text-decoration: none; color: inherit;"><h3 class="event-title">{title}</h3></a>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<h3 class="event-title">{title}</h3>', unsafe_allow_html=True)
-        
-        # Venue
-        location = event.get("location", "")
-        if location:
-            st.markdown(f'<div class="event-venue">{location}</div>', unsafe_allow_html=True)
-        
-        # Meta info (time, cost, category)
-        meta_parts = []
-        if event_time:
-            meta_parts.append(event_time)
-        cost = event.get("cost", "")
-        if cost and cost != "Free":
-            meta_parts.append(cost)
-        category = event.get("category", "")
-        if category:
-            meta_parts.append(category)
-        
-        if meta_parts:
-            meta_text = " • ".join(meta_parts)
-            st.markdown(f'<div class="event-meta">{meta_text}</div>', unsafe_allow_html=True)
-        
-        # Tickets/Details button
-        if link:
-            st.link_button("Tickets", link, use_container_width=True)
-        else:
-            st.button("Details", key=f"event_{event.get('title', '')}", use_container_width=True, disabled=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)  # Close padding
-        st.markdown('</div>', unsafe_allow_html=True)  # Close event-card
+            img = Image.open(io.BytesIO(data))
+            img.thumbnail(CARD_IMAGE_SIZE)
+            out = io.BytesIO()
+            img.convert("RGB").save(out, format="JPEG", quality=80, optimize=True)
+        except (OSError, ValueError):
+            return None, 0
+        data = out.getvalue()
+        mime = "image/jpeg"
+        if len(data) > limit:
+            return None, 0
+    return f"data:{mime};base64," + base64.b64encode(data).decode("ascii"), len(data)
 
+
+def render_event_card_html(event: Dict[str, Any], debug_mode: bool = False) -> str:
+    """
+    Build a Bandsintown-style event card as one HTML string
+    Lets a whole grid of cards be emitted with a single st.markdown call.
+    """
+    return _card_html(event, debug_mode, MAX_INLINE_IMAGE_BYTES)[0]
+
+
+def render_event_grid_html(events: Iterable[Dict[str, Any]], debug_mode: bool = False) -> str:
+    """Build the HTML for a grid of cards, inlining at most MAX_INLINE_GRID_BYTES of images"""
+    cards = []
+    remaining = MAX_INLINE_GRID_BYTES
+    for event in events:
+        card, inlined = _card_html(event, debug_mode, min(MAX_INLINE_IMAGE_BYTES, remaining))
+        remaining -= inlined
+        cards.append(card)
+    return "".join(cards)
+
+
+def _card_html(event: Dict[str, Any], debug_mode: bool, inline_limit: int) -> Tuple[str, int]:
+    """Card HTML plus the number of image bytes inlined into it"""
+    parts = ['<div class="event-card">']
+    inlined = 0
+    
+    # Event image (generated images are inlined as data URIs)
+    _img, error = get_event_image(event)
+    if error:
+        if debug_mode:
+            parts.append(f'<div class="event-debug">Image error: {html.escape(error)}</div>')
+        _img = PLACEHOLDER_IMAGE
+    if isinstance(_img, io.BytesIO):
+        _img, inlined = _image_data_uri(_img, inline_limit)
+        if _img is None:
+            if debug_mode:
+                parts.append('<div class="event-debug">Image too large to inline</div>')
+            _img = PLACEHOLDER_IMAGE
+    if _img:
+        parts.append(f'<img src="{html.escape(_img)}" class="event-image" alt="Event image" />')
+    else:
+        parts.append('<div class="event-image"></div>')
+    
+    # Card content
+    parts.append('<div style="padding: 0.75rem;">')
+    
+    # Format date
+    start = _event_start(event)
+    if start:
+        event_date = start.strftime("%a, %b %d")
+        event_time = start.strftime("%I:%M %p")
+    else:
+        event_date = "TBA"
+        event_time = ""
+    date_display = event_date.upper() if event_date != "TBA" else "TBA"
+    parts.append(f'<div class="event-date-pill">{CALENDAR_SVG} {date_display} {event_time}</div>')
+    
+    # Title as link
+    title = html.escape(event.get("title") or "Event")
+    link = event.get("link")
+    if link:
+        link = html.escape(link)
+        parts.append(f'<a href="{link}" style="text-decoration: none; color: inherit;"><h3 class="event-title">{title}</h3></a>')
+    else:
+        parts.append(f'<h3 class="event-title">{title}</h3>')
+    
+    # Venue
+    location = event.get("location", "")
+    if location:
+        parts.append(f'<div class="event-venue">{html.escape(location)}</div>')
+    
+    # Meta info (time, cost, category)
+    meta_parts = []
+    if event_time:
+        meta_parts.append(event_time)
+    cost = event.get("cost", "")
+    if cost and cost != "Free":
+        meta_parts.append(html.escape(cost))
+    category = event.get("category", "")
+    if category:
+        meta_parts.append(html.escape(category))
+    if meta_parts:
+        parts.append(f'<div class="event-meta">{" • ".join(meta_parts)}</div>')
+    
+    # Tickets/Details button
+    if link:
+        parts.append(f'<a class="event-button" href="{link}" target="_blank">Tickets</a>')
+    else:
+        parts.append('<span class="event-button disabled">Details</span>')
+    
+    parts.append('</div></div>')  # Close padding and event-card
+    return "".join(parts), inlined
@@ -19,7 +19,7 @@ print(f"3-week cutoff: {cutoff.isoformat()}")
 print(f"Looking for events between: {now.date()} and {cutoff.date()}")
 
 # Test each scraper
-from lib.olemiss_athletics_scraper import fetch_olemiss_schedule
+from lib.olemiss_athletics_scraper import fetch_all_olemiss_schedules
 
 test_sources = [
     ("Football", "https://olemisssports.com/sports/football/schedule", "football"),
@@ -37,10 +37,14 @@ print("=" * 70)
 all_events = []
 in_window_events = []
 
-for name, url, sport_type in test_sources:
+# Fetch every schedule concurrently, then report them in order
+schedules = fetch_all_olemiss_schedules(
+    [(url, f"Test {name}", sport_type) for name, url, sport_type in test_sources]
+)
+
+for (name, url, sport_type), events in zip(test_sources, schedules):
     print(f"\n[{name}]")
     try:
-        events = fetch_olemiss_schedule(url, f"Test {name}", sport_type)
         print(f"  Total events found: {len(events)}")
         
         if events:
@@ -5,6 +5,79 @@ Smart categorization for events based on title and description
 import re
 
 
+# Sports keywords - be specific
+SPORTS_KEYWORDS = [
+    'football', 'basketball', 'baseball', 'softball', 'soccer', 'tennis', 
+    'volleyball', 'track', 'swimming', 'golf', 'cross country', 'gymnastics',
+    ' vs ', ' @ ', ' vs. ', 'game', 'match', 'tournament', 'championship',
+    'tailgate', 'athletics', 'pickleball', 'fitness', 'hockey', 'ice hockey'
+]
+
+# Music keywords (but not Performance venues)
+MUSIC_KEYWORDS = [
+    'concert', 'music', 'band', 'dj', 'album', 'song', 'performer', 'artist',
+    'live music', 'acoustic', 'jazz', 'rock', 'folk', 'country', 'blues', 
+    'hip hop', 'rap', 'orchestra', 'symphony', 'percussion', 'ensembles', 
+    'singers', 'choral', 'guitar', 'piano', 'drum', 'bass', 'violin', 
+    'singer', 'fleetwood', 'tribute'
+]
+
+# Performance keywords (Proud Larry's, The Lyric)
+PERFORMANCE_KEYWORDS = [
+    'proud larry', 'the lyric', 'lyric oxford'
+]
+
+# Arts & Culture keywords
+ARTS_KEYWORDS = [
+    'art program', 'theatre', 'theater', 'play', 'drama', 'exhibition',
+    'gallery', 'museum', 'poetry', 'reading', 'author', 'book', 'literary',
+    'film', 'movie', 'documentary', 'cinema', 'screening', 'visual art',
+    'sculpture', 'painting', 'imagination station', 'discovery'
+]
+
+# Religious keywords
+RELIGIOUS_KEYWORDS = [
+    'worship', 'church', 'mass', 'prayer', 'faith', 'bible', 'ministry',
+    'revival', 'service', 'gospel', 'fellowship', 'sermon', 'youth group',
+    'church choir', 'vacation bible school', 'vbs', 'easter', 'christmas cantata'
+]
+
+# Community keywords
+COMMUNITY_KEYWORDS = [
+    'farmers market', 'festival', 'fair', 'recycling', 'community', 'local',
+    'vendor', 'craft', 'pop up shop', 'meet up', 'meeting'
+]
+
+# Education keywords
+EDUCATION_KEYWORDS = [
+    'seminar', 'workshop', 'lecture', 'presentation', 'training',
+    'conference', 'symposium', 'forum', 'panel', 'discussion',
+    'colloquium', 'speaker', 'series', 'bootcamp', 'teaching'
+]
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """One alternation matching any keyword as a substring (text is lower-cased before matching)"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+# Checked in this order; the first category with a matching keyword wins
+_CATEGORY_PATTERNS = (
+    ("Performance", _keyword_pattern(PERFORMANCE_KEYWORDS)),
+    ("Music", _keyword_pattern(MUSIC_KEYWORDS)),
+    ("Arts & Culture", _keyword_pattern(ARTS_KEYWORDS)),
+    ("Sports", _keyword_pattern(SPORTS_KEYWORDS)),
+    ("Education", _keyword_pattern(EDUCATION_KEYWORDS)),
+    ("Religious", _keyword_pattern(RELIGIOUS_KEYWORDS)),
+    ("Community", _keyword_pattern(COMMUNITY_KEYWORDS)),
+)
+
+_SOURCE_SPORT_RE = _keyword_pattern(
+    ['football', 'basketball', 'baseball', 'softball', 'soccer', 'tennis', 'volleyball', 'track', 'mbb', 'wbb']
+)
+_GAME_SPORT_RE = _keyword_pattern(['football', 'basketball', 'game', 'ice hockey', 'hockey'])
+
+
 def categorize_event(title: str, description: str = "", source: str = "", location: str = "") -> str:
     """
     Intelligently categorize an event based on its title, description, source, and location.
@@ -37,7 +110,7 @@ def categorize_event(title: str, description: str = "", source: str = "", locati
     # Check if source indicates Ole Miss Athletics
     # Check for ESPN Ole Miss sources or Ole Miss sports sources
     if ("espn" in source_lower and "ole miss" in source_lower) or \
-       ("ole miss" in source_lower and any(sport in source_lower for sport in ['football', 'basketball', 'baseball', 'softball', 'soccer', 'tennis', 'volleyball', 'track', 'mbb', 'wbb'])):
+       ("ole miss" in source_lower and _SOURCE_SPORT_RE.search(source_lower)):
         return "Ole Miss Athletics"
     
     # Check for Ice Hockey Club events (Ole Miss Athletics)
@@ -45,78 +118,16 @@ def categorize_event(title: str, description: str = "", source: str = "", locati
         return "Ole Miss Athletics"
     
     # Also check if title/description indicates Ole Miss Athletics game
-    if "ole miss" in text and (" vs " in text or " vs. " in text) and any(sport in text for sport in ['football', 'basketball', 'game', 'ice hockey', 'hockey']):
+    if "ole miss" in text and (" vs " in text or " vs. " in text) and _GAME_SPORT_RE.search(text):
         return "Ole Miss Athletics"
     
     # Check for Performance category (Proud Larry's or The Lyric)
     if "proud larry" in text or "the lyric" in text.lower() or "lyric oxford" in text:
         return "Performance"
     
-    # Sports keywords - be specific
-    sports_keywords = [
-        'football', 'basketball', 'baseball', 'softball', 'soccer', 'tennis', 
-        'volleyball', 'track', 'swimming', 'golf', 'cross country', 'gymnastics',
-        ' vs ', ' @ ', ' vs. ', 'game', 'match', 'tournament', 'championship',
-        'tailgate', 'athletics', 'pickleball', 'fitness', 'hockey', 'ice hockey'
-    ]
-    
-    # Music keywords (but not Performance venues)
-    music_keywords = [
-        'concert', 'music', 'band', 'dj', 'album', 'song', 'performer', 'artist',
-        'live music', 'acoustic', 'jazz', 'rock', 'folk', 'country', 'blues', 
-        'hip hop', 'rap', 'orchestra', 'symphony', 'percussion', 'ensembles', 
-        'singers', 'choral', 'guitar', 'piano', 'drum', 'bass', 'violin', 
-        'singer', 'fleetwood', 'tribute'
-    ]
-    
-    # Performance keywords (Proud Larry's, The Lyric)
-    performance_keywords = [
-        'proud larry', 'the lyric', 'lyric oxford'
-    ]
-    
-    # Arts & Culture keywords
-    arts_keywords = [
-        'art program', 'theatre', 'theater', 'play', 'drama', 'exhibition',
-        'gallery', 'museum', 'poetry', 'reading', 'author', 'book', 'literary',
-        'film', 'movie', 'documentary', 'cinema', 'screening', 'visual art',
-        'sculpture', 'painting', 'imagination station', 'discovery'
-    ]
-    
-    # Religious keywords
-    religious_keywords = [
-        'worship', 'church', 'mass', 'prayer', 'faith', 'bible', 'ministry',
-        'revival', 'service', 'gospel', 'fellowship', 'sermon', 'youth group',
-        'church choir', 'vacation bible school', 'vbs', 'easter', 'christmas cantata'
-    ]
-
-    # Community keywords
-    community_keywords = [
-        'farmers market', 'festival', 'fair', 'recycling', 'community', 'local',
-        'vendor', 'craft', 'pop up shop', 'meet up', 'meeting'
-    ]
-    
-    # Education keywords
-    education_keywords = [
-        'seminar', 'workshop', 'lecture', 'presentation', 'training',
-        'conference', 'symposium', 'forum', 'panel', 'discussion',
-        'colloquium', 'speaker', 'series', 'bootcamp', 'teaching'
-    ]
-    
     # Check in priority order (most specific first)
-    if any(keyword in text for keyword in performance_keywords):
-        return "Performance"
-    elif any(keyword in text for keyword in music_keywords):
-        return "Music"
-    elif any(keyword in text for keyword in arts_keywords):
-        return "Arts & Culture"
-    elif any(keyword in text for keyword in sports_keywords):
-        return "Sports"
-    elif any(keyword in text for keyword in education_keywords):
-        return "Education"
-    elif any(keyword in text for keyword in religious_keywords):
-        return "Religious"
-    elif any(keyword in text for keyword in community_keywords):
-        return "Community"
-    else:
-        return "University"
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(text):
+            return category
+    return "University"
 
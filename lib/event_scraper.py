@@ -3,17 +3,42 @@ Event scraping utilities for fetching from multiple sources
 """
 
 import io
+import json
 import re
 import time
-import copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from dateutil import parser as dtp, tz
 import requests
+from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
 from icalendar import Calendar
 import feedparser
 from bs4 import BeautifulSoup
 
+from lib.categorizer import categorize_event
+from lib.http_cache import conditional_headers, cached_payload, store_payload, flush_cache
+
+try:
+    from lib.status_tracker import set_status, clear_status
+except Exception:
+    # Status reporting is optional (e.g. when scrapers run from scripts)
+    def set_status(step: int, total_steps: int, message: str, details: str = ""):
+        pass
+
+    def clear_status():
+        pass
+
+
+# Shared keep-alive session for every source fetch; sources on the same host
+# (and repeated scrapes) reuse pooled connections instead of new TCP/TLS handshakes
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
 
 LAST_SOURCE_METRICS: Dict[str, Any] = {
     "generated_at": None,
@@ -22,6 +47,16 @@ LAST_SOURCE_METRICS: Dict[str, Any] = {
 }
 
 
+# Human-readable source type names shown in loading status messages
+SOURCE_TYPE_LABELS = {
+    'ics': 'calendar',
+    'rss': 'RSS feed',
+    'html': 'website',
+    'api': 'API',
+    'olemiss': 'sports schedule',
+}
+
+
 ATHLETICS_HOME_KEYWORDS = [
     "oxford",
     "pavilion",
@@ -42,22 +77,52 @@ ATHLETICS_HOME_KEYWORDS = [
     "ole miss golf",
 ]
 
+_ATHLETICS_HOME_RE = re.compile(
+    '|'.join(re.escape(keyword) for keyword in ATHLETICS_HOME_KEYWORDS), re.IGNORECASE
+)
+
 
 def _is_oxford_home_game(location: Optional[str]) -> bool:
     """Return True if the athletics event appears to be played in Oxford/home venues."""
     if not location:
         return False
-    location_lower = location.lower()
-    return any(keyword in location_lower for keyword in ATHLETICS_HOME_KEYWORDS)
+    return _ATHLETICS_HOME_RE.search(location) is not None
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """Parse an event start string, caching results since feeds repeat them."""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    try:
+        return dtp.parse(value)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _event_timestamp(start_iso: Optional[str], naive_tz=None) -> Optional[float]:
+    """Return the POSIX timestamp for start_iso (naive values are in naive_tz, default local time)."""
+    if not start_iso:
+        return None
+    parsed = _parse_iso(start_iso)
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=naive_tz or tz.tzlocal())
+    try:
+        return parsed.timestamp()
+    except (OverflowError, ValueError, OSError):
+        return None
 
 
 def fetch_ics_events(url: str, source_name: str) -> List[Dict[str, Any]]:
     """Fetch events from an ICS calendar URL"""
-    from lib.categorizer import categorize_event
     
     events = []
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         if response.status_code == 200:
             cal = Calendar.from_ical(response.content)
             for component in cal.walk():
@@ -89,11 +154,12 @@ def fetch_ics_events(url: str, source_name: str) -> List[Dict[str, Any]]:
 
 def fetch_rss_events(url: str, source_name: str) -> List[Dict[str, Any]]:
     """Fetch events from an RSS feed"""
-    from lib.categorizer import categorize_event
     
     events = []
     try:
-        feed = feedparser.parse(url)
+        # Fetch through the shared session (keep-alive + timeout), then let feedparser parse the bytes
+        response = _SESSION.get(url, timeout=10, headers={'User-Agent': feedparser.USER_AGENT})
+        feed = feedparser.parse(response.content, response_headers=dict(response.headers))
         for entry in feed.entries[:50]:  # Limit to 50 events
             # Extract location from title (format: "Event Name at Location")
             location = ''
@@ -105,8 +171,7 @@ def fetch_rss_events(url: str, source_name: str) -> List[Dict[str, Any]]:
             
             # Parse HTML to clean description
             if raw_desc:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(raw_desc, 'html.parser')
+                soup = BeautifulSoup(raw_desc, 'lxml')
                 clean_desc = soup.get_text(separator=' ', strip=True)
             else:
                 clean_desc = ''
@@ -136,7 +201,6 @@ def fetch_rss_events(url: str, source_name: str) -> List[Dict[str, Any]]:
                 date_str = entry.updated
             elif hasattr(entry, 'published_parsed') and entry.published_parsed:
                 # Use parsed date if available
-                from datetime import datetime
                 try:
                     date_str = datetime(*entry.published_parsed[:6]).isoformat()
                 except:
@@ -157,21 +221,34 @@ def fetch_rss_events(url: str, source_name: str) -> List[Dict[str, Any]]:
     return events
 
 
+# Browser-like headers so event sites don't block the scraper
+_HTML_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Parsed HTML events depend on the parser and on "now" (Bandsintown infers the year from it),
+# so cached copies carry a version and are only revalidated for an hour before a full re-parse
+HTML_PARSER_VERSION = 1
+HTML_CACHE_MAX_AGE = 3600
+
+
 def fetch_html_events(url: str, source_name: str, parser: str = None) -> List[Dict[str, Any]]:
     """
     Fetch events from HTML pages using site-specific parsers
     """
     events = []
     try:
-        # Add headers to avoid being blocked
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-        response = requests.get(url, timeout=10, headers=headers)
+        # Revalidate against the last parsed copy; a 304 skips download and parsing
+        headers = {**_HTML_HEADERS, **conditional_headers(url, HTML_PARSER_VERSION, HTML_CACHE_MAX_AGE)}
+        response = _SESSION.get(url, timeout=10, headers=headers)
+        if response.status_code == 304:
+            cached = cached_payload(url, HTML_PARSER_VERSION, HTML_CACHE_MAX_AGE)
+            if cached is not None:
+                return cached
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Use parser-specific logic
             if parser == 'bandsintown':
@@ -181,12 +258,28 @@ def fetch_html_events(url: str, source_name: str, parser: str = None) -> List[Di
             elif parser == 'simple_list':
                 # Generic parser - try to extract basic event info
                 events = _parse_generic(soup, source_name, url)
+            
+            if events:
+                store_payload(url, response.headers, events, version=HTML_PARSER_VERSION)
+                flush_cache()
     except Exception as e:
         print(f"Error fetching HTML from {url}: {e}")
     
     return events
 
 
+# Bandsintown date text like "Nov 7", "Nov 7 - 7:00 pm"
+_BANDSINTOWN_DATE_RE = re.compile(r'([A-Za-z]{3})\s+(\d{1,2})(?:\s*-\s*(\d{1,2}):(\d{2})\s*(am|pm))?', re.IGNORECASE)
+_MONTH_NUMBERS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+# Bandsintown event pages live under /e/
+_BANDSINTOWN_EVENT_HREF_RE = re.compile(r'/e/')
+_URL_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_WINDOW_DATA_RE = re.compile(r'window\.__data\s*=\s*({.*?});', re.DOTALL)
+
+
 def _parse_bandsintown(soup, source_name: str, base_url: str) -> List[Dict[str, Any]]:
     """Parse Bandsintown HTML - uses data-test attributes"""
     events = []
@@ -200,7 +293,7 @@ def _parse_bandsintown(soup, source_name: str, base_url: str) -> List[Dict[str,
                 # Extract event link
                 link_elem = container.find('a', {'data-test': 'popularEvent__link'})
                 if not link_elem:
-                    link_elem = container.find('a', href=lambda x: x and '/e/' in str(x) if x else False)
+                    link_elem = container.find('a', href=_BANDSINTOWN_EVENT_HREF_RE)
                 
                 link = link_elem.get('href', '') if link_elem else base_url
                 if link.startswith('/'):
@@ -232,12 +325,10 @@ def _parse_bandsintown(soup, source_name: str, base_url: str) -> List[Dict[str,
                         date_text = date_elem.get_text(strip=True)
                         if date_text:
                             # Parse format like "Nov 7 - 7:00 pm" or "Nov 7" or "Nov 7, 2025"
-                            import re
-                            from datetime import datetime
                             
                             # Try to extract month, day, and time
                             # Pattern: "Nov 7" or "Nov 7 - 7:00 pm" or "Nov 7, 2025"
-                            date_match = re.search(r'([A-Za-z]{3})\s+(\d{1,2})(?:\s*-\s*(\d{1,2}):(\d{2})\s*(am|pm))?', date_text, re.IGNORECASE)
+                            date_match = _BANDSINTOWN_DATE_RE.search(date_text)
                             if date_match:
                                 month_str = date_match.group(1)
                                 day = int(date_match.group(2))
@@ -248,11 +339,7 @@ def _parse_bandsintown(soup, source_name: str, base_url: str) -> List[Dict[str,
                                 current_month = now.month
                                 
                                 # Convert month string to number
-                                month_map = {
-                                    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                                    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                                }
-                                month = month_map.get(month_str.lower()[:3])
+                                month = _MONTH_NUMBERS.get(month_str.lower()[:3])
                                 
                                 # If the event month is earlier in the year than current month,
                                 # assume it's next year (e.g., if it's Nov 2025 and event is Jan, it's Jan 2026)
@@ -294,8 +381,7 @@ def _parse_bandsintown(soup, source_name: str, base_url: str) -> List[Dict[str,
                 # Also check link for date information
                 if not date_str and link:
                     # Try to extract date from URL pattern
-                    import re
-                    date_match = re.search(r'(\d{4}-\d{2}-\d{2})', link)
+                    date_match = _URL_DATE_RE.search(link)
                     if date_match:
                         date_str = date_match.group(1)
                 
@@ -359,21 +445,19 @@ def _parse_bandsintown(soup, source_name: str, base_url: str) -> List[Dict[str,
         # Also try to extract from JavaScript data if available
         if not events:
             # Look for window.__data which contains event data
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string and 'window.__data' in script.string:
-                    try:
-                        import json
-                        import re
-                        # Extract JSON data from script
-                        match = re.search(r'window\.__data\s*=\s*({.*?});', script.string, re.DOTALL)
-                        if match:
-                            data = json.loads(match.group(1))
-                            # Navigate through data structure to find events
-                            # This structure varies, so we'll try common paths
-                            print("[Bandsintown] Found JavaScript data, but parsing structure varies")
-                    except:
-                        pass
+            # (find() stops at the first matching script instead of listing every <script>)
+            script = soup.find('script', string=_WINDOW_DATA_RE)
+            if script:
+                try:
+                    # Extract JSON data from script
+                    match = _WINDOW_DATA_RE.search(script.string)
+                    if match:
+                        data = json.loads(match.group(1))
+                        # Navigate through data structure to find events
+                        # This structure varies, so we'll try common paths
+                        print("[Bandsintown] Found JavaScript data, but parsing structure varies")
+                except ValueError:
+                    pass
     except Exception as e:
         print(f"[Bandsintown] Error parsing: {e}")
     
@@ -381,39 +465,43 @@ def _parse_bandsintown(soup, source_name: str, base_url: str) -> List[Dict[str,
     return events
 
 
+# Class matchers for the generic HTML parsers; bs4 tries them against each class value
+_EVENT_CLASS_RE = re.compile(r'event', re.IGNORECASE)
+_TITLE_CLASS_RE = re.compile(r'title', re.IGNORECASE)
+_DATE_CLASS_RE = re.compile(r'date', re.IGNORECASE)
+_LOCATION_CLASS_RE = re.compile(r'location|venue', re.IGNORECASE)
+
+
 def _parse_visit_oxford(soup, source_name: str, base_url: str) -> List[Dict[str, Any]]:
     """Parse Visit Oxford HTML"""
     events = []
     try:
         # Visit Oxford specific parsing
-        event_elements = soup.find_all(['article', 'div', 'li'], class_=lambda x: x and 'event' in x.lower() if x else False)
+        event_elements = soup.find_all(['article', 'div', 'li'], class_=_EVENT_CLASS_RE)
         
         for elem in event_elements:
             try:
                 # Extract title
-                title_elem = elem.find(['h2', 'h3', 'a'], class_=lambda x: x and 'title' in x.lower() if x else False)
+                title_elem = elem.find(['h2', 'h3', 'a'], class_=_TITLE_CLASS_RE)
                 if not title_elem:
                     title_elem = elem.find(['h2', 'h3', 'h4'])
                 title = title_elem.get_text(strip=True) if title_elem else ''
                 
                 # Extract date
-                date_elem = elem.find(class_=lambda x: x and 'date' in x.lower())
+                date_elem = elem.find(class_=_DATE_CLASS_RE)
                 date_str = date_elem.get_text(strip=True) if date_elem else ''
                 
                 # Extract location
-                location_elem = elem.find(class_=lambda x: x and ('location' in x.lower() or 'venue' in x.lower()))
+                location_elem = elem.find(class_=_LOCATION_CLASS_RE)
                 location = location_elem.get_text(strip=True) if location_elem else 'Oxford, MS'
                 
                 # Extract link
                 link_elem = elem.find('a', href=True)
-                link = link_elem['href'] if link_elem else base_url
-                if link.startswith('/'):
-                    link = base_url.rstrip('/') + link
+                link = urljoin(base_url, link_elem['href']) if link_elem else base_url
                 
                 if title and date_str:
                     try:
                         parsed_date = dtp.parse(date_str)
-                        from lib.categorizer import categorize_event
                         category = categorize_event(title, "", source_name, location)
                         event = {
                             "title": title,
@@ -441,7 +529,7 @@ def _parse_generic(soup, source_name: str, base_url: str) -> List[Dict[str, Any]
     events = []
     try:
         # Look for common event patterns
-        event_elements = soup.find_all(['article', 'div'], class_=lambda x: x and ('event' in x.lower() if x else False))
+        event_elements = soup.find_all(['article', 'div'], class_=_EVENT_CLASS_RE)
         
         for elem in event_elements:
             try:
@@ -449,7 +537,6 @@ def _parse_generic(soup, source_name: str, base_url: str) -> List[Dict[str, Any]
                 title = title_elem.get_text(strip=True) if title_elem else ''
                 
                 if title:
-                    from lib.categorizer import categorize_event
                     location = "Oxford, MS"
                     category = categorize_event(title, "", source_name, location)
                     event = {
@@ -498,7 +585,7 @@ def fetch_seatgeek_events(lat: float, lon: float, radius: str = "25mi") -> List[
         }
         
         print(f"[SeatGeek] Searching by coordinates: lat={lat}, lon={lon}, radius={radius}")
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -594,7 +681,6 @@ def fetch_seatgeek_events(lat: float, lon: float, radius: str = "25mi") -> List[
                         break
                 
                 # Determine category using categorize_event (for Turner Center detection)
-                from lib.categorizer import categorize_event
                 category = categorize_event(title, description, "SeatGeek", venue_location)
                 
                 # If Ole Miss Athletics was detected, add it to the category
@@ -655,7 +741,7 @@ def fetch_seatgeek_events(lat: float, lon: float, radius: str = "25mi") -> List[
                         'page': 1
                     }
                     print(f"[SeatGeek] Searching by query: '{query}'")
-                    query_response = requests.get(url, params=query_params, timeout=10)
+                    query_response = _SESSION.get(url, params=query_params, timeout=10)
                     
                     if query_response.status_code == 200:
                         query_data = query_response.json()
@@ -750,7 +836,6 @@ def fetch_seatgeek_events(lat: float, lon: float, radius: str = "25mi") -> List[
                                     event_image = first_performer.get('image')
                             
                             # Determine category
-                            from lib.categorizer import categorize_event
                             category = categorize_event(title, description, "SeatGeek", venue_location)
                             
                             if is_olemiss_athletics and "Ole Miss Athletics" not in category:
@@ -837,7 +922,7 @@ def fetch_ticketmaster_events(city: str, state_code: str) -> List[Dict[str, Any]
             'stateCode': state_code,
             'size': 100
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -859,7 +944,6 @@ def fetch_ticketmaster_events(city: str, state_code: str) -> List[Dict[str, Any]
                 venue_location = f"{venue_name}, {city}"
                 
                 # Use categorize_event for Turner Center detection
-                from lib.categorizer import categorize_event
                 description = item.get('info', '') or item.get('description', '')
                 category = categorize_event(item.get('name', ''), description, "Ticketmaster", venue_location)
                 
@@ -943,17 +1027,16 @@ def fetch_ticketmaster_events(city: str, state_code: str) -> List[Dict[str, Any]
     return events
 
 
+# Leading "vs"/"@"/"at" markers on ESPN opponent cells
+_OPPONENT_PREFIX_RE = re.compile(r'^\s*(vs|VS|v\.|versus|@|at)\s*')
+
+
 def fetch_espn_schedule(url: str, source_name: str, sport_type: str = "football") -> List[Dict[str, Any]]:
     """
     Fetch events from ESPN schedule page using Selenium
     Filters out away games (@ prefix) and only includes home games
     Always selects the most recent year automatically
     """
-    from lib.categorizer import categorize_event
-    from dateutil import parser as dtp
-    from datetime import datetime
-    import time
-    import re
     
     events = []
     
@@ -1122,7 +1205,7 @@ def fetch_espn_schedule(url: str, source_name: str, sport_type: str = "football"
                         continue
                     
                     # Clean opponent name (remove vs, @, etc.)
-                    opponent_clean = re.sub(r'^\s*(vs|VS|v\.|versus|@|at)\s*', '', opponent_text).strip()
+                    opponent_clean = _OPPONENT_PREFIX_RE.sub('', opponent_text).strip()
                     
                     # Skip placeholder text
                     if opponent_clean in ['OPPONENT', 'TBD', 'TBA', ''] or len(opponent_clean) < 2:
@@ -1216,7 +1299,7 @@ def fetch_espn_schedule(url: str, source_name: str, sport_type: str = "football"
                                     if parsed_date.hour == 0:
                                         parsed_date = parsed_date.replace(hour=19, minute=0)
                                     
-                                    opponent_clean = re.sub(r'^\s*(vs|VS|v\.|versus|@|at)\s*', '', opponent_text).strip()
+                                    opponent_clean = _OPPONENT_PREFIX_RE.sub('', opponent_text).strip()
                                     
                                     if sport_type == "football":
                                         location = "Vaught-Hemingway Stadium"
@@ -1264,215 +1347,218 @@ def fetch_espn_schedule(url: str, source_name: str, sport_type: str = "football"
     return events
 
 
+_OLEMISS_SPORTS_BASE = "https://olemisssports.com/sports"
+_SPORT_TO_URL = {
+    "football": f"{_OLEMISS_SPORTS_BASE}/football/schedule",
+    "mens-basketball": f"{_OLEMISS_SPORTS_BASE}/mens-basketball/schedule",
+    "womens-basketball": f"{_OLEMISS_SPORTS_BASE}/womens-basketball/schedule",
+}
+
+
 def _convert_espn_to_olemiss_url(espn_url: str, sport_type: str) -> str:
     """Convert ESPN URL to Ole Miss Athletics schedule URL"""
-    base_url = "https://olemisssports.com/sports"
-    
-    if sport_type == "football":
-        return f"{base_url}/football/schedule"
-    elif "basketball" in sport_type.lower():
-        if "women" in espn_url.lower() or "wbb" in espn_url.lower():
-            return f"{base_url}/womens-basketball/schedule"
-        else:
-            return f"{base_url}/mens-basketball/schedule"
+    sport = sport_type.lower()
+    if sport == "football":
+        return _SPORT_TO_URL["football"]
+    if "basketball" in sport:
+        url = espn_url.lower()
+        if "women" in url or "wbb" in url:
+            return _SPORT_TO_URL["womens-basketball"]
+        return _SPORT_TO_URL["mens-basketball"]
     
     return None
 
 
+# Visit Oxford titles matching both patterns are athletics duplicates
+_VO_TEAM_RE = re.compile(r'ole miss|rebels')
+_VO_SPORT_RE = re.compile(r' vs\.? | game|football|basketball|baseball')
+
+# Date/time suffixes (e.g. "Sep 6 / 6pm") stripped from titles before deduplication
+_DATE_TAIL1 = re.compile(r'\s*[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*(noon|\d{1,2}\s*[ap]m)', re.IGNORECASE)
+_DATE_TAIL2 = re.compile(r'\s*/\s*(noon|\d{1,2}\s*[ap]m)', re.IGNORECASE)
+
+
+MAX_FETCH_WORKERS = 16
+
+
+def _source_url(source: Dict[str, Any]) -> Optional[str]:
+    """URL shown in source metrics (API sources fall back to the provider's site)"""
+    source_url = source.get('url')
+    if not source_url and source.get('type') == 'api':
+        parser = source.get('parser')
+        if parser == 'ticketmaster':
+            source_url = 'https://www.ticketmaster.com'
+        elif parser == 'seatgeek':
+            source_url = 'https://seatgeek.com'
+        elif parser == 'bandsintown':
+            source_url = 'https://www.bandsintown.com'
+    return source_url
+
+
+def _fetch_source(source: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Fetch one configured source's events"""
+    source_type = source.get('type')
+    source_name = source.get('name', 'Unknown')
+    events: List[Dict[str, Any]] = []
+    if source_type == 'ics':
+        url = source.get('url')
+        if url:
+            events = fetch_ics_events(url, source_name)
+    
+    elif source_type == 'rss':
+        url = source.get('url')
+        if url:
+            events = fetch_rss_events(url, source_name)
+    
+    elif source_type == 'html':
+        url = source.get('url')
+        parser = source.get('parser')
+        if url:
+            # Use enhanced scraper for Visit Oxford (follows links)
+            if parser == 'visit_oxford':
+                try:
+                    from lib.visit_oxford_scraper import fetch_visit_oxford_events
+                    events = fetch_visit_oxford_events(url, source_name)
+                    print(f"[collect_all_events] {source_name} (Enhanced): {len(events)} events found")
+                except Exception as e:
+                    print(f"[collect_all_events] Visit Oxford scraper failed/timed out: {str(e)[:100]}")
+                    # Skip Visit Oxford if it fails to prevent worker timeout
+                    events = []
+            else:
+                events = fetch_html_events(url, source_name, parser=parser)
+    
+    elif source_type == 'api':
+        parser = source.get('parser')
+        if parser == 'seatgeek':
+            lat = source.get('lat')
+            lon = source.get('lon')
+            radius = source.get('radius', '25mi')
+            if lat and lon:
+                events = fetch_seatgeek_events(lat, lon, radius)
+        elif parser == 'ticketmaster':
+            city = source.get('city')
+            state_code = source.get('stateCode')
+            if city and state_code:
+                events = fetch_ticketmaster_events(city, state_code)
+    
+    return events
+
+
+def _fetch_source_timed(source: Dict[str, Any]) -> Tuple[List[Tuple[Dict[str, Any], Optional[float]]], Optional[str], float]:
+    """
+    Fetch a source, returning ([(event, start_ts), ...], error, duration_ms)
+    Each start time is parsed once here (in the worker) so later passes compare floats;
+    the timestamp rides alongside the event rather than being stored on it.
+    Errors are caught so one failing source never blocks the others
+    """
+    start_time = time.perf_counter()
+    try:
+        events = [(event, _event_timestamp(event.get('start_iso'))) for event in _fetch_source(source)]
+        error = None
+    except Exception as e:
+        print(f"[collect_all_events] ERROR fetching {source.get('name', 'Unknown')}: {str(e)[:100]}")
+        events = []
+        error = str(e)
+    return events, error, (time.perf_counter() - start_time) * 1000.0
+
+
 def collect_all_events(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Collect events from all sources"""
     # Initialize status tracking
-    try:
-        from lib.status_tracker import set_status, clear_status
-        total_steps = len(sources) + 2  # Each source + filtering + finalizing
-        set_status(0, total_steps, "Starting to load events...", "")
-    except Exception:
-        pass
+    total_steps = len(sources) + 2  # Each source + filtering + finalizing
+    set_status(0, total_steps, "Starting to load events...", "")
     
-    all_events = []
+    all_events = []  # (event, start_ts) pairs
     metrics: Dict[str, Dict[str, Any]] = {}
     
-    for idx, source in enumerate(sources):
-        source_type = source.get('type')
-        source_name = source.get('name', 'Unknown')
-        source_url = source.get('url')
-        if not source_url and source_type == 'api':
-            parser = source.get('parser')
-            if parser == 'ticketmaster':
-                source_url = 'https://www.ticketmaster.com'
-            elif parser == 'seatgeek':
-                source_url = 'https://seatgeek.com'
-            elif parser == 'bandsintown':
-                source_url = 'https://www.bandsintown.com'
-        metrics[source_name] = {
-            "status": "pending",
-            "duration_ms": 0.0,
-            "fetched_events": 0,
-            "events_total": 0,
-            "events_last_week": 0,
-            "error": None,
-            "url": source_url,
-        }
-        
-        # Update status for this source
-        try:
-            from lib.status_tracker import set_status
-            source_type_name = {
-                'ics': 'calendar',
-                'rss': 'RSS feed',
-                'html': 'website',
-                'api': 'API',
-                'olemiss': 'sports schedule'
-            }.get(source_type, 'source')
-            set_status(idx + 1, len(sources) + 2, f"Checking {source_name}...", f"Loading from {source_type_name}")
-        except Exception:
-            pass
-        
-        # Wrap each source fetch in try/except to prevent one failure from blocking others
-        events: List[Dict[str, Any]] = []
-        start_time = time.perf_counter()
-        try:
-            if source_type == 'ics':
-                url = source.get('url')
-                if url:
-                    events = fetch_ics_events(url, source_name)
-                    all_events.extend(events)
-            
-            elif source_type == 'rss':
-                url = source.get('url')
-                if url:
-                    events = fetch_rss_events(url, source_name)
-                    all_events.extend(events)
-            
-            elif source_type == 'html':
-                url = source.get('url')
-                parser = source.get('parser')
-                if url:
-                    # Use enhanced scraper for Visit Oxford (follows links)
-                    if parser == 'visit_oxford':
-                        try:
-                            from lib.visit_oxford_scraper import fetch_visit_oxford_events
-                            events = fetch_visit_oxford_events(url, source_name)
-                            print(f"[collect_all_events] {source_name} (Enhanced): {len(events)} events found")
-                        except Exception as e:
-                            print(f"[collect_all_events] Visit Oxford scraper failed/timed out: {str(e)[:100]}")
-                            # Skip Visit Oxford if it fails to prevent worker timeout
-                            events = []
-                    else:
-                        events = fetch_html_events(url, source_name, parser=parser)
-                    all_events.extend(events)
+    # Fetches are network-bound, so run them concurrently; map() yields results in
+    # source order, which keeps dedup (first occurrence wins) deterministic
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(sources)))) as executor:
+        results = executor.map(_fetch_source_timed, sources)
+        for idx, (source, (events, error, duration_ms)) in enumerate(zip(sources, results)):
+            source_type = source.get('type')
+            source_name = source.get('name', 'Unknown')
+            metrics[source_name] = {
+                "status": "error" if error else "ok",
+                "duration_ms": duration_ms,
+                "fetched_events": len(events),
+                "events_total": 0,
+                "events_last_week": 0,
+                "error": error,
+                "url": _source_url(source),
+            }
             
-            elif source_type == 'api':
-                parser = source.get('parser')
-                if parser == 'seatgeek':
-                    lat = source.get('lat')
-                    lon = source.get('lon')
-                    radius = source.get('radius', '25mi')
-                    if lat and lon:
-                        events = fetch_seatgeek_events(lat, lon, radius)
-                        all_events.extend(events)
-                elif parser == 'ticketmaster':
-                    city = source.get('city')
-                    state_code = source.get('stateCode')
-                    if city and state_code:
-                        events = fetch_ticketmaster_events(city, state_code)
-                        all_events.extend(events)
-                elif parser == 'seatgeek':
-                    lat = source.get('lat')
-                    lon = source.get('lon')
-                    radius = source.get('radius', '25mi')
-                    if lat and lon:
-                        events = fetch_seatgeek_events(lat, lon, radius)
-                        all_events.extend(events)
+            # Update status as each source's result comes back (set_status is a cheap tuple swap)
+            source_type_name = SOURCE_TYPE_LABELS.get(source_type, 'source')
+            set_status(idx + 1, total_steps, f"Checked {source_name}", f"Loaded from {source_type_name}")
             
-            metrics[source_name]["fetched_events"] += len(events)
-            metrics[source_name]["status"] = "ok"
-        except Exception as e:
-            # Log error but continue processing other sources
-            print(f"[collect_all_events] ERROR fetching {source_name}: {str(e)[:100]}")
-            metrics[source_name]["status"] = "error"
-            metrics[source_name]["error"] = str(e)
-        finally:
-            metrics[source_name]["duration_ms"] = (time.perf_counter() - start_time) * 1000.0
+            all_events.extend(events)
     
     # Filter out duplicates (especially Ole Miss Athletic events from Visit Oxford)
     print(f"[collect_all_events] Removing duplicates from {len(all_events)} total events")
     
-    seen_events = {}
+    seen_events = set()
     deduplicated_events = []
     
-    for event in all_events:
-        # Clean title for deduplication (remove date patterns that might be in opponent)
+    for event, event_ts in all_events:
         title = event.get('title', '').lower().strip()
+        
+        # Skip Ole Miss Athletic events from Visit Oxford (they're duplicates)
+        if 'visit oxford' in event.get('source', '').lower():
+            if _VO_TEAM_RE.search(title) and _VO_SPORT_RE.search(title):
+                print(f"[collect_all_events] Filtering duplicate athletic event from Visit Oxford: {event.get('title')}")
+                continue
+        
+        # Clean title for deduplication (remove date patterns that might be in opponent)
         # Remove date/time patterns from title for better duplicate detection
-        import re
-        title_clean = re.sub(r'\s*[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*(noon|\d{1,2}\s*[ap]m)', '', title, flags=re.IGNORECASE)
-        title_clean = re.sub(r'\s*/\s*(noon|\d{1,2}\s*[ap]m)', '', title_clean, flags=re.IGNORECASE)
+        title_clean = _DATE_TAIL1.sub('', title)
+        title_clean = _DATE_TAIL2.sub('', title_clean)
         title_clean = title_clean.strip()
         
         date = event.get('start_iso', '')
         location = event.get('location', '').lower().strip()
         
-        # Skip Ole Miss Athletic events from Visit Oxford (they're duplicates)
-        source_lower = event.get('source', '').lower()
-        if 'visit oxford' in source_lower:
-            title_lower = title.lower()
-            # Check if it's an athletic event
-            if any(keyword in title_lower for keyword in ['ole miss', 'rebels']) and \
-               any(sport in title_lower for sport in [' vs ', ' vs. ', ' game', 'football', 'basketball', 'baseball']):
-                print(f"[collect_all_events] Filtering duplicate athletic event from Visit Oxford: {event.get('title')}")
-                continue
-        
         # Create deduplication key using cleaned title
         # For Ole Miss Athletics, be more lenient - only deduplicate if exact match
         category_str = event.get("category", "")
         is_athletics = "Ole Miss Athletics" in category_str
         
+        # Tuple keys hash their parts directly instead of building a joined string
         if is_athletics:
             # For athletics, use source + title + date for deduplication (more specific)
-            source = event.get('source', '')
-            key = f"{source}_{title_clean}_{date}_{location}"
+            key = (event.get('source', ''), title_clean, date, location)
         else:
             # For other events, use standard deduplication
-            key = f"{title_clean}_{date}_{location}"
+            key = (title_clean, date, location)
         
         # Skip if we've seen this exact event before
         if key in seen_events:
-            print(f"[collect_all_events] Filtering duplicate: {event.get('title')} (key: {key[:80]})")
+            print(f"[collect_all_events] Filtering duplicate: {event.get('title')}")
             continue
         
-        seen_events[key] = True
-        deduplicated_events.append(event)
+        seen_events.add(key)
+        deduplicated_events.append((event, event_ts))
     
     print(f"[collect_all_events] After deduplication: {len(deduplicated_events)} events")
 
     now_utc = datetime.now(timezone.utc)
-    one_week_ago = now_utc - timedelta(days=7)
-    for event in deduplicated_events:
-        source = event.get('source') or 'Unknown'
-        if source not in metrics:
+    one_week_ts = (now_utc - timedelta(days=7)).timestamp()
+    for event, _ in deduplicated_events:
+        source_metrics = metrics.get(event.get('source') or 'Unknown')
+        if not source_metrics:
             continue
-        metrics[source]["events_total"] += 1
-        start_iso = event.get('start_iso')
-        if not start_iso:
-            continue
-        try:
-            event_dt = datetime.fromisoformat(start_iso.replace('Z', '+00:00'))
-        except Exception:
-            try:
-                event_dt = dtp.parse(start_iso)
-            except Exception:
-                continue
-        if event_dt.tzinfo is None:
-            event_dt = event_dt.replace(tzinfo=timezone.utc)
-        else:
-            event_dt = event_dt.astimezone(timezone.utc)
-        if event_dt >= one_week_ago:
-            metrics[source]["events_last_week"] += 1
+        source_metrics["events_total"] += 1
+        # This metric has always read naive start times as UTC (the 3-week window uses
+        # local time); _parse_iso is cached, so this doesn't parse start_iso again
+        event_ts = _event_timestamp(event.get('start_iso'), timezone.utc)
+        if event_ts is not None and event_ts >= one_week_ts:
+            source_metrics["events_last_week"] += 1
     
     # Filter to next 3 weeks
     now = datetime.now(tz.tzlocal())
     cutoff = now + timedelta(days=21)
+    now_ts = now.timestamp()
+    cutoff_ts = cutoff.timestamp()
     filtered_events = []
     
     print(f"[collect_all_events] Filtering {len(deduplicated_events)} events to next 3 weeks (now={now.isoformat()}, cutoff={cutoff.isoformat()})")
@@ -1482,50 +1568,43 @@ def collect_all_events(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     athletics_before_filter = 0
     
     # Count athletics events before filtering
-    for event in deduplicated_events:
+    for event, _ in deduplicated_events:
         category_str = event.get("category", "")
         if "Ole Miss Athletics" in category_str:
             athletics_before_filter += 1
     
     print(f"[collect_all_events] Found {athletics_before_filter} Ole Miss Athletics events before date filtering")
     
-    for event in deduplicated_events:
+    for event, event_ts in deduplicated_events:
         if event.get("start_iso"):
-            try:
-                event_date = dtp.parse(event["start_iso"])
-                # Ensure event_date is timezone-aware for comparison
-                if event_date.tzinfo is None:
-                    event_date = event_date.replace(tzinfo=tz.tzlocal())
-                
-                # Check if this is an athletics event (category might be "Ole Miss Athletics" or "Ole Miss Athletics, SeatGeek")
-                category_str = event.get("category", "")
-                is_athletics = "Ole Miss Athletics" in category_str
-                if is_athletics:
-                    athletics_count += 1
-                    if not _is_oxford_home_game(event.get("location")):
-                        print(f"[collect_all_events] Skipping non-home athletics event: {event.get('title')} @ {event.get('location')}")
-                        continue
-                
-                if now <= event_date <= cutoff:
-                    filtered_events.append(event)
-                    if is_athletics:
-                        athletics_filtered += 1
-                elif is_athletics:
-                    # Log athletics events that are filtered out for debugging
-                    days_diff = (event_date - now).days
-                    if days_diff < 0:
-                        print(f"[collect_all_events] Athletics event filtered (past): {event.get('title')} - {event_date.isoformat()}")
-                    else:
-                        print(f"[collect_all_events] Athletics event filtered (too far): {event.get('title')} - {event_date.isoformat()} ({days_diff} days away)")
-            except Exception as e:
+            # Check if this is an athletics event (category might be "Ole Miss Athletics" or "Ole Miss Athletics, SeatGeek")
+            category_str = event.get("category", "")
+            is_athletics = "Ole Miss Athletics" in category_str
+            if event_ts is None:
                 # For athletics events, log the error but don't skip - try to keep them
-                category_str = event.get("category", "")
-                is_athletics = "Ole Miss Athletics" in category_str
                 if is_athletics:
-                    print(f"[collect_all_events] ERROR parsing date for athletics event {event.get('title', 'unknown')}: {e} - start_iso: {event.get('start_iso')}")
+                    print(f"[collect_all_events] ERROR parsing date for athletics event {event.get('title', 'unknown')} - start_iso: {event.get('start_iso')}")
                 else:
-                    print(f"[collect_all_events] Error parsing date for event {event.get('title', 'unknown')}: {e}")
+                    print(f"[collect_all_events] Error parsing date for event {event.get('title', 'unknown')}: {event.get('start_iso')}")
                 continue
+
+            if is_athletics:
+                athletics_count += 1
+                if not _is_oxford_home_game(event.get("location")):
+                    print(f"[collect_all_events] Skipping non-home athletics event: {event.get('title')} @ {event.get('location')}")
+                    continue
+
+            if now_ts <= event_ts <= cutoff_ts:
+                filtered_events.append((event, event_ts))
+                if is_athletics:
+                    athletics_filtered += 1
+            elif is_athletics:
+                # Log athletics events that are filtered out for debugging
+                days_diff = int((event_ts - now_ts) // 86400)
+                if days_diff < 0:
+                    print(f"[collect_all_events] Athletics event filtered (past): {event.get('title')} - {event['start_iso']}")
+                else:
+                    print(f"[collect_all_events] Athletics event filtered (too far): {event.get('title')} - {event['start_iso']} ({days_diff} days away)")
         else:
             # Log events without dates, especially athletics
             category_str = event.get("category", "")
@@ -1538,7 +1617,7 @@ def collect_all_events(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     # Filter out training events
     original_count = len(filtered_events)
     filtered_events = [
-        event for event in filtered_events
+        (event, event_ts) for event, event_ts in filtered_events
         if "training" not in event.get("title", "").lower() and 
            "training" not in event.get("description", "").lower()
     ]
@@ -1554,7 +1633,7 @@ def collect_all_events(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     ]
     
     filtered_events = [
-        event for event in filtered_events
+        (event, event_ts) for event, event_ts in filtered_events
         if not any(
             keyword in event.get("title", "").lower() or 
             keyword in event.get("description", "").lower() or
@@ -1566,14 +1645,10 @@ def collect_all_events(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         print(f"[collect_all_events] Filtered out {original_count - len(filtered_events)} LGBTQ+ related events")
     
     # Update status - filtering complete
-    try:
-        from lib.status_tracker import set_status
-        set_status(len(sources) + 1, len(sources) + 2, "Sorting events by date...", f"Found {len(filtered_events)} events")
-    except Exception:
-        pass
+    set_status(len(sources) + 1, total_steps, "Sorting events by date...", f"Found {len(filtered_events)} events")
     
     # Sort by date
-    result = sorted(filtered_events, key=lambda x: x.get("start_iso", ""))
+    result = [event for event, _ in sorted(filtered_events, key=itemgetter(1))]
     
     # Add image URLs to events (pre-generate and cache)
     try:
@@ -1582,11 +1657,7 @@ def collect_all_events(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         print(f"[collect_all_events] Warning: Could not add image URLs: {e}")
     
     # Clear status when complete
-    try:
-        from lib.status_tracker import clear_status
-        clear_status()
-    except Exception:
-        pass
+    clear_status()
 
     for data in metrics.values():
         data["duration_ms"] = round(data["duration_ms"], 2)
@@ -1607,8 +1678,13 @@ def collect_all_events(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 
 def get_last_source_metrics() -> Dict[str, Any]:
-    """Return a deep copy of the most recent scraper metrics."""
-    return copy.deepcopy(LAST_SOURCE_METRICS)
+    """Return a copy of the most recent scraper metrics."""
+    # Per-source entries only hold flat scalars, so copying each dict is
+    # enough to isolate callers without a recursive deepcopy walk.
+    return {
+        **LAST_SOURCE_METRICS,
+        "sources": {name: data.copy() for name, data in LAST_SOURCE_METRICS["sources"].items()},
+    }
 
 
 def _add_image_urls_to_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -1668,32 +1744,47 @@ def _add_image_urls_to_events(events: List[Dict[str, Any]]) -> List[Dict[str, An
     return events
 
 
-def detect_sports_teams(title: str) -> Optional[Tuple[Tuple[str, str], Tuple[str, str]]]:
-    """Detect two teams from event title (for sports logo generation)"""
-    # Import team mappings
+_VS_PATTERN = re.compile(r'(.+?)\s+(?:vs|@|v\.|versus)\s+(.+?)(?:\s+(?:in|at)|$)')
+
+
+@lru_cache(maxsize=1)
+def _teams_longest_first() -> Tuple[Tuple[str, Tuple[str, List[str]]], ...]:
+    """TEAM_NAMES entries ordered longest key first, built once per process."""
+    # Import team mappings lazily (utils.image_processing pulls in Pillow)
     from utils.image_processing import TEAM_NAMES
-    
-    title_lower = title.lower()
-    vs_pattern = r'(.+?)\s+(?:vs|@|v\.|versus)\s+(.+?)(?:\s+(?:in|at)|$)'
-    match = re.search(vs_pattern, title_lower)
+    return tuple(sorted(TEAM_NAMES.items(), key=lambda x: len(x[0]), reverse=True))
+
+
+def _find_team(text: str) -> Tuple[Optional[str], Optional[List[str]]]:
+    text_lower = text.strip()
+    for key, (name, logo_urls) in _teams_longest_first():
+        if key in text_lower:
+            return name, logo_urls
+    return None, None
+
+
+@lru_cache(maxsize=2048)
+def _detect_sports_teams_lower(title_lower: str):
+    match = _VS_PATTERN.search(title_lower)
     if not match:
         return None
-    
+
     team1_text, team2_text = match.groups()
-    
-    def find_team(text):
-        text_lower = text.lower().strip()
-        sorted_teams = sorted(TEAM_NAMES.items(), key=lambda x: len(x[0]), reverse=True)
-        for key, (name, logo_urls) in sorted_teams:
-            if key in text_lower:
-                return name, logo_urls
-        return None, None
-    
-    team1_result = find_team(team1_text)
-    team2_result = find_team(team2_text)
-    
+    team1_result = _find_team(team1_text)
+    team2_result = _find_team(team2_text)
+
     if team1_result[0] and team2_result[0]:
         return team1_result, team2_result
-    
+
     return None
 
+
+def detect_sports_teams(title: str) -> Optional[Tuple[Tuple[str, str], Tuple[str, str]]]:
+    """Detect two teams from event title (for sports logo generation)"""
+    # Titles repeat across scrapes, so results are memoized on the lowercased title;
+    # hand out fresh logo lists so callers can't mutate the cached entry
+    result = _detect_sports_teams_lower(title.lower())
+    if result is None:
+        return None
+    (name1, logos1), (name2, logos2) = result
+    return (name1, list(logos1)), (name2, list(logos2))
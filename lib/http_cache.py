@@ -0,0 +1,135 @@
+"""
+Conditional-GET cache for scraped pages
+Keeps each URL's ETag / Last-Modified validators next to its parsed result,
+so an unchanged page (HTTP 304) can be reused without downloading or re-parsing.
+Entries carry the parser version that produced them and expire after a max age, and
+the least recently used ones are dropped past MAX_ENTRIES.
+Stores only update memory; the fetch functions call flush_cache() to write the file.
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+CACHE_FILENAME = 'http_cache.json'
+MAX_ENTRIES = 500  # least recently used entries are dropped beyond this
+MAX_AGE_SECONDS = 6 * 3600  # older entries get a full fetch and re-parse instead of a revalidation
+
+_LOCK = threading.Lock()
+_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+_DIRTY = False  # in-memory entries not yet written to disk
+
+
+def _cache_path() -> str:
+    from utils.storage import get_json_db_path
+    return get_json_db_path(CACHE_FILENAME)
+
+
+def _load() -> Dict[str, Dict[str, Any]]:
+    """Load the cache file once per process (caller holds _LOCK)"""
+    global _CACHE
+    if _CACHE is None:
+        try:
+            with open(_cache_path(), 'r', encoding='utf-8') as f:
+                _CACHE = json.load(f)
+        except (OSError, ValueError):
+            _CACHE = {}
+    return _CACHE
+
+
+def _save(cache: Dict[str, Dict[str, Any]]) -> None:
+    """Write the cache atomically so a crash never leaves a truncated file (caller holds _LOCK)"""
+    path = _cache_path()
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[HTTP Cache] Could not write {path}: {e}")
+    except (TypeError, ValueError, RuntimeError) as e:
+        # A payload that isn't JSON-serializable; keep the previous file
+        print(f"[HTTP Cache] Could not serialize cache: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _usable_entry(url: str, version: int, max_age: float) -> Optional[Dict[str, Any]]:
+    """Return the entry for a URL unless it is missing, too old or from another parser version (caller holds _LOCK)"""
+    cache = _load()
+    entry = cache.get(url)
+    if not entry or 'payload' not in entry or entry.get('version') != version:
+        return None
+    if time.time() - entry.get('stored_at', 0) > max_age:
+        return None
+    # Dicts keep insertion order (also through the JSON file), so the end is most recently used
+    cache[url] = cache.pop(url)
+    return entry
+
+
+def conditional_headers(url: str, version: int = 0, max_age: float = MAX_AGE_SECONDS) -> Dict[str, str]:
+    """Return If-None-Match / If-Modified-Since headers for a URL with a usable cached payload"""
+    with _LOCK:
+        entry = _usable_entry(url, version, max_age)
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def cached_payload(url: str, version: int = 0, max_age: float = MAX_AGE_SECONDS) -> Optional[Any]:
+    """Return a private copy of the usable payload stored for a URL, or None"""
+    with _LOCK:
+        entry = _usable_entry(url, version, max_age)
+        # Callers annotate the returned events in place, so never hand out the cached objects
+        return copy.deepcopy(entry['payload']) if entry else None
+
+
+def store_payload(url: str, response_headers, payload: Any, version: int = 0) -> None:
+    """
+    Remember a parsed payload with the response's validators
+    Responses without an ETag or Last-Modified are not cached, since they can't be revalidated
+    """
+    etag = response_headers.get('ETag')
+    last_modified = response_headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    # Store a snapshot, since the caller keeps (and may mutate) its own objects. Round-tripping
+    # through JSON deep-copies and also keeps anything unserializable out of the cache.
+    try:
+        payload = json.loads(json.dumps(payload))
+    except (TypeError, ValueError) as e:
+        print(f"[HTTP Cache] Not caching {url}: {e}")
+        return
+    global _DIRTY
+    with _LOCK:
+        cache = _load()
+        cache.pop(url, None)
+        cache[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'version': version,
+            'stored_at': time.time(),
+            'payload': payload,
+        }
+        while len(cache) > MAX_ENTRIES:
+            del cache[next(iter(cache))]
+        _DIRTY = True
+
+
+def flush_cache() -> None:
+    """Write the cache file if anything was stored since the last flush"""
+    global _DIRTY
+    with _LOCK:
+        if _DIRTY:
+            _save(_CACHE)
+            _DIRTY = False
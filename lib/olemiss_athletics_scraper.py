@@ -4,11 +4,174 @@ Uses simple HTML parsing instead of Selenium (works without Chrome)
 """
 
 import re
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dateutil import parser as dtp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+from lib.http_cache import conditional_headers, cached_payload, store_payload, flush_cache
+
+
+# Shared session so repeated schedule fetches reuse the olemisssports.com connection
+_SESSION = requests.Session()
+# One quick retry for connect failures and transient 5xx instead of waiting out the timeout
+_RETRY = Retry(
+    total=1,
+    connect=1,
+    read=0,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({'GET'}),
+    raise_on_status=False,
+)
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY))
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+})
+
+
+# Schedule parsing strategies, in default order; _METHOD_HINTS remembers per URL
+# which one last produced games so it can be tried first
+_PARSE_METHODS = ('calendar', 'text', 'table')
+_METHOD_HINTS: Dict[str, str] = {}
+
+# Schedule pages are well under this; anything larger is truncated rather than buffered whole
+MAX_SCHEDULE_BYTES = 2_000_000
+
+# Bump whenever parsing changes so cached schedules from the old parser are refetched
+PARSER_VERSION = 1
+
+# Patterns are compiled once here rather than on every page/element parse
+# Schedule text: "Nov 8 ... vs Opponent"
+_GAME_PATTERN = re.compile(r'([A-Z][a-z]{2})\s+(\d{1,2}).*?(vs|at)\s+([A-Z][^,\n]+)', re.IGNORECASE | re.DOTALL)
+_SCHEDULE_CLASS_RE = re.compile(r'schedule|calendar', re.IGNORECASE)
+_CALENDAR_ITEM_CLASS_RE = re.compile(r'game|schedule|event', re.IGNORECASE)
+_CANDIDATE_CLASS_RE = re.compile(r'schedule|game|event|calendar', re.IGNORECASE)
+
+# Opponent cleanup, fused so each opponent string is scanned once:
+# "Nov 15 / 2:30-3:30 or 5-7 PM vs " prefixes and date/time fragments like
+# "Nov 08 / Noon", "11/8 / 7 PM" or "/ 12 PM"
+_OPP_NOISE_RE = re.compile(
+    r'[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*[^vs]+?\s+vs\s+'
+    r'|\s*[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*[^A-Z]+?vs\s+'
+    r'|\s*[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*(?:Noon|\d{1,2}\s*[AP]M|\d{1,2}:\d{2}[^\s]*?)'
+    r'|\s*\d{1,2}/\d{1,2}\s*/\s*(?:Noon|\d{1,2}\s*[AP]M)'
+    r'|\s*/\s*(?:Noon|\d{1,2}\s*[AP]M|\d{1,2}:\d{2}[^\s]*?\s*(?:or|PM|AM|pm|am))',
+    re.IGNORECASE,
+)
+# Trailing location / logo text glued onto opponents scraped from page text and game
+# elements (case-sensitive, and not used on table cells, which hold just the name)
+_OPP_LOCATION_TAIL_RE = re.compile(r'\s+(?:Oxford|Miss\.).*$')
+_OPP_LOGO_TAIL_RE = re.compile(r'\s+(?:Logo|Oxford|Miss\.).*$')
+# Leading duplicate "vs" and ranking ("#12 ") on game-element opponents
+_OPP_PREFIX_RE = re.compile(r'^(?:\s*vs\s+)?(?:#?\d+\s+)?', re.IGNORECASE)
+_OPPONENT_PREFIX_RE = re.compile(r'^\s*(vs|VS|v\.|versus|@|at)\s*')
+
+# Game element parsing
+_MONTH_DAY_RE = re.compile(r'([A-Z][a-z]{2})\s+(\d{1,2})')
+_GAME_MATCH_RE = re.compile(r'\b(vs|at)\s+([A-Z#][A-Za-z\s&]+?)(?:\s*[,\n\(]|\s*$|Logo|Oxford|Miss\.)', re.IGNORECASE)
+_GAME_MATCH_FALLBACK_RE = re.compile(r'(vs|at)\s+([A-Z#][^,\n\(]+)', re.IGNORECASE)
+_TIME_RE = re.compile(r'(Noon|12\s*[Pp][Mm]|(\d{1,2}):?(\d{2})?\s*([AaPp][Mm])|(\d{1,2})\s*([Pp][Mm]))', re.IGNORECASE)
+_DIGITS_RE = re.compile(r'\d+')
+
+# Opponent cells that are schedule placeholders rather than real teams (upper-cased)
+_PLACEHOLDER_OPPONENTS = frozenset({'OPPONENT', 'TBD', 'TBA', ''})
+# Date cells of header/placeholder rows (upper-cased)
+_PLACEHOLDER_DATES = frozenset({'DATE', 'TBD', 'TBA', ''})
+
+# Plain schedule dates ("Sep 13", "Sat, Sep 13", "Sept. 2, 2025", "11/08", "9/2/2025") parsed without dateutil
+_FAST_DATE_RE = re.compile(
+    r'^\s*(?:(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s+)?'
+    r'(?:(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?'
+    r'|(\d{1,2})/(\d{1,2})(?:/(\d{4}|\d{2}))?)\s*$',
+    re.IGNORECASE,
+)
+_MONTH_NUMBERS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+# "jan", "Jan" and "JAN" all map directly, so regex-captured abbreviations need no normalizing
+_MONTH_MAP = {
+    variant: number
+    for abbr, number in _MONTH_NUMBERS.items()
+    for variant in (abbr, abbr.capitalize(), abbr.upper())
+}
+
+# Parse filter for pages whose schedule is known to live in <table> rows
+_TABLES_ONLY = SoupStrainer('table')
+
+# Schedule list items
+_ITEM_DATE_RE = re.compile(r'(\w+\s+\d+|\d+/\d+)')
+_ITEM_OPPONENT_RE = re.compile(r'(?:vs|@|at)\s+([A-Z][^,\n]+)', re.IGNORECASE)
+
+
+def _read_capped(response: requests.Response, limit: int) -> bytes:
+    """Read a streamed response body, stopping once `limit` bytes have arrived"""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) >= limit:
+            print(f"[Ole Miss Athletics] Response from {response.url} exceeded {limit} bytes, truncating")
+            del body[limit:]
+            break
+    return bytes(body)
+
+
+# (location, title prefix, sport description) for sports with a single home venue
+_SPORT_DETAILS = {
+    "football": ("Vaught-Hemingway Stadium", "Ole Miss vs", "Football"),
+    "baseball": ("Swayze Field", "Ole Miss vs", "Baseball"),
+    "softball": ("Ole Miss Softball Complex", "Ole Miss vs", "Softball"),
+    "volleyball": ("The Pavilion", "Ole Miss vs", "Volleyball"),
+}
+
+
+@lru_cache(maxsize=64)
+def _resolve_sport(sport_type: str, source_name: str, url: str) -> Tuple[str, str, str]:
+    """Return (location, title prefix, sport description) for a schedule source"""
+    details = _SPORT_DETAILS.get(sport_type)
+    if details is not None:
+        return details
+    sport_type_lower = sport_type.lower()
+    if "basketball" in sport_type_lower:
+        # Determine if men's or women's basketball based on sport_type or source, then URL
+        source_lower = source_name.lower()
+        url_lower = url.lower()
+        if "women" in sport_type_lower or "wbb" in sport_type_lower or "women" in source_lower:
+            womens = True
+        elif "men" in sport_type_lower or "mbb" in sport_type_lower or "men" in source_lower:
+            womens = False
+        else:
+            womens = "womens" in url_lower or "women" in url_lower
+        if womens:
+            return "The Pavilion", "Ole Miss Women's Basketball vs", "Women's Basketball"
+        return "The Pavilion", "Ole Miss Men's Basketball vs", "Men's Basketball"
+    return "TBD", "Ole Miss vs", sport_type.title()
+
+
+@lru_cache(maxsize=64)
+def _event_template(sport_type: str, source_name: str, url: str) -> Tuple[str, str, Dict[str, str]]:
+    """
+    Return (title head, description head, constant fields) for a schedule source
+    Per game only the opponent and start time still need to be filled in
+    """
+    location, title_prefix, sport_desc = _resolve_sport(sport_type, source_name, url)
+    title_head = f"{title_prefix} "
+    base = {
+        "location": location,
+        "category": "Ole Miss Athletics",
+        "source": source_name,
+        "link": url,
+        "cost": "Varies",
+    }
+    return title_head, f"{sport_desc} game: {title_head}", base
 
 
 def fetch_olemiss_schedule(url: str, source_name: str, sport_type: str = "football") -> List[Dict[str, Any]]:
@@ -20,16 +183,20 @@ def fetch_olemiss_schedule(url: str, source_name: str, sport_type: str = "footba
     events = []
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-        
         print(f"[Ole Miss Athletics] Fetching schedule from: {url}")
         # Reduced timeout to 10s - fail faster to avoid worker timeouts
         try:
-            response = requests.get(url, timeout=10, headers=headers)
+            # Revalidate against the last parsed copy; a 304 skips download and parsing
+            with _SESSION.get(url, timeout=10, stream=True, headers=conditional_headers(url, PARSER_VERSION)) as response:
+                if response.status_code == 304:
+                    cached = cached_payload(url, PARSER_VERSION)
+                    if cached is not None:
+                        print(f"[Ole Miss Athletics] Schedule unchanged, reusing {len(cached)} cached games")
+                        return cached  # already a private copy
+                if response.status_code != 200:
+                    print(f"[Ole Miss Athletics] Error: Got status code {response.status_code} from {url}")
+                    return events
+                body = _read_capped(response, MAX_SCHEDULE_BYTES)
         except requests.exceptions.Timeout:
             print(f"[Ole Miss Athletics] Timeout fetching schedule from {url} (10s)")
             return events
@@ -37,157 +204,56 @@ def fetch_olemiss_schedule(url: str, source_name: str, sport_type: str = "footba
             print(f"[Ole Miss Athletics] Error fetching schedule from {url}: {e}")
             return events
         
-        if response.status_code != 200:
-            print(f"[Ole Miss Athletics] Error: Got status code {response.status_code}")
-            return events
-        
-        try:
-            soup = BeautifulSoup(response.content, 'html.parser')
-        except Exception as e:
-            print(f"[Ole Miss Athletics] Error parsing HTML from {url}: {e}")
-            return events
-        
         # Ole Miss Athletics pages use divs with game information
         # Look for schedule items - they contain date, opponent, and game info
         # Common patterns: divs with dates, "vs" indicators, game centers
         
-        # Try finding game entries by looking for "vs" and "at" patterns
-        # Games are often in divs or sections with dates and team names
-        all_text = soup.get_text()
-        
-        # Look for date patterns followed by opponent info
-        # Pattern: Date (like "Nov 8", "Sep 13") followed by "vs" or "at"
-        
-        # Method 1: Find schedule container and parse games
-        schedule_container = soup.find(['div', 'section'], class_=lambda x: x and ('schedule' in str(x).lower() if x else False))
-        
-        # Method 2: Look for game entries by finding "vs" and "at" patterns with dates
-        # Find all text that contains date patterns and game indicators
-        game_pattern = re.compile(r'([A-Z][a-z]{2})\s+(\d{1,2}).*?(vs|at)\s+([A-Z][^,\n]+)', re.IGNORECASE | re.DOTALL)
-        matches = game_pattern.findall(all_text)
-        
-        # Method 3: Find divs containing game information
-        # Look for elements that contain both date and opponent info
-        game_elements = soup.find_all(['div', 'li', 'tr'], string=re.compile(r'(vs|at)\s+[A-Z]'))
-        
-        # Also try finding by looking for game links or calendar entries
-        calendar_items = soup.find_all(['div', 'article'], class_=lambda x: x and (
-            'game' in str(x).lower() or 
-            'schedule' in str(x).lower() or
-            'event' in str(x).lower()
-        ) if x else False)
-        
-        # Try to extract games from various structures
+        # One clock read per page; every game is resolved against the same "now"
+        now = datetime.now()
         seen_games = set()  # Avoid duplicates
         
-        # Process calendar items first
-        for item in calendar_items:
-            event = _parse_game_element(item, source_name, sport_type, url, seen_games)
-            if event:
-                events.append(event)
+        # Each schedule URL keeps one layout, so the method that worked last time
+        # runs first and the others are only tried if it comes back empty
+        hint = _METHOD_HINTS.get(url)
+        methods = _PARSE_METHODS if hint is None else (hint,) + tuple(m for m in _PARSE_METHODS if m != hint)
+        if hint == 'table':
+            # Known table layout: build only the <table> subtrees and skip nav/footer/scripts
+            try:
+                events = _events_from_tables(BeautifulSoup(body, 'lxml', parse_only=_TABLES_ONLY),
+                                             source_name, sport_type, url, now)
+            except Exception as e:
+                print(f"[Ole Miss Athletics] Error parsing tables from {url}: {e}")
+            methods = methods[1:]
         
-        # If no events from calendar items, try parsing text patterns
         if not events:
-            for match in matches:
-                month_abbr, day, game_type, opponent = match
-                # Skip away games
-                if game_type.lower() == 'at':
-                    continue
-                
-                # Parse date
-                try:
-                    month_map = {
-                        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                    }
-                    month = month_map.get(month_abbr.lower()[:3])
-                    day_int = int(day)
-                    current_year = datetime.now().year
-                    
-                    # Create date string for deduplication
-                    game_key = f"{month_abbr} {day} vs {opponent.strip()}"
-                    if game_key in seen_games:
-                        continue
-                    seen_games.add(game_key)
-                    
-                    # Determine year (if month has passed, assume next year)
-                    parsed_date = datetime(current_year, month, day_int, 19, 0)
-                    if parsed_date < datetime.now():
-                        parsed_date = datetime(current_year + 1, month, day_int, 19, 0)
-                    
-                    # Parse time from context if available (would need more sophisticated parsing)
-                    # For now, default to 7 PM
-                    
-                    opponent_clean = opponent.strip()
-                    # Clean opponent name - remove date/time patterns
-                    opponent_clean = opponent_clean.strip()
-                    # Remove date patterns like "Nov 08 / Noon" or "Nov 8 / 12 PM"
-                    opponent_clean = re.sub(r'\s*[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*(Noon|\d{1,2}\s*[AP]M)', '', opponent_clean, flags=re.IGNORECASE)
-                    opponent_clean = re.sub(r'\s*/\s*(Noon|\d{1,2}\s*[AP]M)', '', opponent_clean, flags=re.IGNORECASE)
-                    opponent_clean = re.sub(r'\s*\d{1,2}/\d{1,2}\s*/\s*(Noon|\d{1,2}\s*[AP]M)', '', opponent_clean, flags=re.IGNORECASE)
-                    opponent_clean = re.sub(r'\s+Oxford.*$', '', opponent_clean, flags=re.IGNORECASE)
-                    opponent_clean = re.sub(r'\s+Miss\..*$', '', opponent_clean, flags=re.IGNORECASE)
-                    opponent_clean = opponent_clean.strip()
-                    
-                    if not opponent_clean or len(opponent_clean) < 2:
-                        continue
-                    
-                    # Determine location and title based on sport
-                    if sport_type == "football":
-                        location = "Vaught-Hemingway Stadium"
-                        title = f"Ole Miss vs {opponent_clean}"
-                        sport_desc = "Football"
-                    elif "basketball" in sport_type.lower():
-                        location = "The Pavilion"
-                        # Determine if men's or women's basketball based on sport_type or source
-                        sport_type_lower = sport_type.lower()
-                        source_lower = source_name.lower()
-                        if "women" in sport_type_lower or "wbb" in sport_type_lower or "women" in source_lower:
-                            title = f"Ole Miss Women's Basketball vs {opponent_clean}"
-                            sport_desc = "Women's Basketball"
-                        elif "men" in sport_type_lower or "mbb" in sport_type_lower or "men" in source_lower:
-                            title = f"Ole Miss Men's Basketball vs {opponent_clean}"
-                            sport_desc = "Men's Basketball"
-                        else:
-                            # Default based on URL
-                            if "womens" in url.lower() or "women" in url.lower():
-                                title = f"Ole Miss Women's Basketball vs {opponent_clean}"
-                                sport_desc = "Women's Basketball"
-                            else:
-                                title = f"Ole Miss Men's Basketball vs {opponent_clean}"
-                                sport_desc = "Men's Basketball"
+            try:
+                soup = BeautifulSoup(body, 'lxml')
+            except Exception as e:
+                print(f"[Ole Miss Athletics] Error parsing HTML from {url}: {e}")
+                return events
+            
+            candidates = None
+            for method in methods:
+                if method == 'table':
+                    events = _events_from_tables(soup, source_name, sport_type, url, now)
+                else:
+                    if candidates is None:
+                        # Single tree walk for every schedule/game/event/calendar-classed element
+                        candidates = soup.find_all(['div', 'section', 'article'], class_=_CANDIDATE_CLASS_RE)
+                    if method == 'calendar':
+                        events = _events_from_calendar_items(candidates, source_name, sport_type, url, seen_games, now)
                     else:
-                        location = "TBD"
-                        title = f"Ole Miss vs {opponent_clean}"
-                        sport_desc = sport_type.title()
-                    
-                    events.append({
-                        "title": title,
-                        "start_iso": parsed_date.isoformat(),
-                        "location": location,
-                        "description": f"{sport_desc} game: {title}",
-                        "category": "Ole Miss Athletics",
-                        "source": source_name,
-                        "link": url,
-                        "cost": "Varies"
-                    })
-                except Exception as e:
-                    print(f"[Ole Miss Athletics] Error parsing match {match}: {e}")
-                    continue
-        
-        # If still no events, try table parsing as fallback
-        if not events:
-            schedule_tables = soup.find_all('table')
-            for table in schedule_tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    if row.find('th'):
-                        continue
-                    event = _parse_table_row(row, source_name, sport_type, url)
-                    if event:
-                        events.append(event)
-        
-        print(f"[Ole Miss Athletics] Found {len(events)} home games")
+                        events = _events_from_text(soup, candidates, source_name, sport_type, url, seen_games, now)
+                if events:
+                    _METHOD_HINTS[url] = method
+                    break
+        
+        if events:
+            # store_payload keeps its own snapshot, so the events returned below can be mutated freely
+            store_payload(url, response.headers, events, version=PARSER_VERSION)
+            flush_cache()
+        
+        print(f"[Ole Miss Athletics] Found {len(events)} home games at {url}")
         
     except Exception as e:
         print(f"[Ole Miss Athletics] Error fetching schedule from {url}: {e}")
@@ -197,16 +263,144 @@ def fetch_olemiss_schedule(url: str, source_name: str, sport_type: str = "footba
     return events
 
 
-def _parse_table_row(row, source_name: str, sport_type: str, base_url: str) -> Dict[str, Any]:
-    """Parse a table row to extract game information"""
+def fetch_all_olemiss_schedules(specs: List[Tuple[str, str, str]], max_workers: int = 6) -> List[List[Dict[str, Any]]]:
+    """
+    Fetch several (url, source_name, sport_type) schedules concurrently
+    Returns one event list per spec, in the same order as `specs`
+    """
+    if not specs:
+        return []
+    results: List[List[Dict[str, Any]]] = [[] for _ in specs]
+    # Fetches are network-bound; the shared session's pool keeps connections warm across threads
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+        futures = {
+            executor.submit(fetch_olemiss_schedule, url, source_name, sport_type): idx
+            for idx, (url, source_name, sport_type) in enumerate(specs)
+        }
+        for future in as_completed(futures):
+            # fetch_olemiss_schedule handles its own errors and returns [] on failure
+            results[futures[future]] = future.result()
+    return results
+
+
+def _events_from_calendar_items(candidates, source_name: str, sport_type: str, url: str,
+                                seen_games: set, now: datetime) -> List[Dict[str, Any]]:
+    """Parse game/schedule/event-classed divs and articles (game links or calendar entries)"""
+    events = []
+    template = _event_template(sport_type, source_name, url)
+    for item in candidates:
+        if item.name == 'section' or not _CALENDAR_ITEM_CLASS_RE.search(' '.join(item.get('class', ()))):
+            continue
+        event = _parse_game_element(item, source_name, sport_type, url, seen_games, now=now, template=template)
+        if event:
+            events.append(event)
+    return events
+
+
+def _events_from_text(soup: BeautifulSoup, candidates, source_name: str, sport_type: str, url: str,
+                      seen_games: set, now: datetime) -> List[Dict[str, Any]]:
+    """Scan page text for date patterns (like "Nov 8") followed by "vs"/"at" and opponent"""
+    events = []
+    # Location/title/description are fixed for the whole schedule page
+    title_head, desc_head, base = _event_template(sport_type, source_name, url)
+    current_year = now.year
+    
+    # Find schedule container; only scan the whole page if it yields nothing
+    schedule_container = next(
+        (el for el in candidates
+         if el.name != 'article' and _SCHEDULE_CLASS_RE.search(' '.join(el.get('class', ())))),
+        None,
+    )
+    scoped_text = schedule_container.get_text() if schedule_container is not None else None
+    if scoped_text is None or not _GAME_PATTERN.search(scoped_text):
+        scoped_text = soup.get_text()
+    
+    # Bind hot globals/attributes to locals once for the loop below
+    month_get = _MONTH_MAP.get
+    sub_noise = _OPP_NOISE_RE.sub
+    sub_location = _OPP_LOCATION_TAIL_RE.sub
+    make_dt = datetime
+    append = events.append
+    
+    # Matches are streamed rather than collected into a list of tuples up front
+    for match in _GAME_PATTERN.finditer(scoped_text):
+        # Skip away games before unpacking or building any strings
+        if match.group(3).lower() == 'at':
+            continue
+        month_abbr, day, game_type, opponent = match.groups()
+        
+        # Parse date
+        try:
+            month = month_get(month_abbr) or month_get(month_abbr.lower())
+            day_int = int(day)
+            
+            # Create date string for deduplication
+            game_key = f"{month_abbr} {day} vs {opponent.strip()}"
+            if game_key in seen_games:
+                continue
+            seen_games.add(game_key)
+            
+            # Determine year (if month has passed, assume next year)
+            parsed_date = make_dt(current_year, month, day_int, 19, 0)
+            if parsed_date < now:
+                parsed_date = make_dt(current_year + 1, month, day_int, 19, 0)
+            
+            # Parse time from context if available (would need more sophisticated parsing)
+            # For now, default to 7 PM
+            
+            # Clean opponent name - remove date/time patterns and trailing location
+            opponent_clean = sub_location('', sub_noise('', opponent.strip())).strip()
+            
+            if not opponent_clean or len(opponent_clean) < 2:
+                continue
+            
+            append({
+                "title": title_head + opponent_clean,
+                "start_iso": parsed_date.isoformat(),
+                "description": desc_head + opponent_clean,
+                **base,
+            })
+        except Exception as e:
+            print(f"[Ole Miss Athletics] Error parsing match {match.groups()}: {e}")
+            continue
+    return events
+
+
+def _events_from_tables(soup: BeautifulSoup, source_name: str, sport_type: str, url: str,
+                        now: datetime) -> List[Dict[str, Any]]:
+    """Parse schedule table rows, skipping header rows"""
+    parse = _parse_table_row
+    # Location/title/description are fixed for the whole schedule page
+    template = _event_template(sport_type, source_name, url)
+    rows = (parse(row, source_name, sport_type, url, now=now, template=template) for row in _iter_rows(soup))
+    return [event for event in rows if event]
+
+
+def _iter_rows(soup: BeautifulSoup):
+    """Yield the data rows (no <th> cells) of every table on the page"""
+    for table in soup.find_all('table'):
+        for row in table.find_all('tr'):
+            if not row.find('th'):
+                yield row
+
+
+def _parse_table_row(row, source_name: str, sport_type: str, base_url: str, now: Optional[datetime] = None,
+                     template: Optional[Tuple[str, str, Dict[str, str]]] = None) -> Dict[str, Any]:
+    """
+    Parse a table row to extract game information
+    `template` is the page's _event_template result, resolved once by the caller when given
+    """
+    if now is None:
+        now = datetime.now()
     try:
         cells = row.find_all(['td', 'th'])
         if len(cells) < 2:
             return None
         
-        # Extract date from first cell
+        # Extract date from first cell; header/placeholder rows ("Date", "TBA") are
+        # dropped before any opponent cleanup or dateutil fallback
         date_text = cells[0].get_text(strip=True)
-        if not date_text:
+        if date_text.upper() in _PLACEHOLDER_DATES:
             return None
         
         # Extract opponent from second cell (usually)
@@ -226,151 +420,146 @@ def _parse_table_row(row, source_name: str, sport_type: str, base_url: str) -> D
             return None
         
         # Clean opponent name - remove vs/@ prefixes and date/time patterns
-        opponent_clean = re.sub(r'^\s*(vs|VS|v\.|versus|@|at)\s*', '', opponent_text).strip()
+        opponent_clean = _OPPONENT_PREFIX_RE.sub('', opponent_text).strip()
         # Remove date patterns like "Nov 08 / Noon" or "Nov 8 / 12 PM"
-        opponent_clean = re.sub(r'\s*[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*(Noon|\d{1,2}\s*[AP]M)', '', opponent_clean, flags=re.IGNORECASE)
-        opponent_clean = re.sub(r'\s*/\s*(Noon|\d{1,2}\s*[AP]M)', '', opponent_clean, flags=re.IGNORECASE)
-        opponent_clean = re.sub(r'\s*\d{1,2}/\d{1,2}\s*/\s*(Noon|\d{1,2}\s*[AP]M)', '', opponent_clean, flags=re.IGNORECASE)
+        opponent_clean = _OPP_NOISE_RE.sub('', opponent_clean)
         
         # Skip placeholder text
-        if opponent_clean in ['OPPONENT', 'TBD', 'TBA', ''] or len(opponent_clean) < 2:
+        if len(opponent_clean) < 2 or opponent_clean.upper() in _PLACEHOLDER_OPPONENTS:
             return None
         
-        # Parse date
+        # Parse date (bare month/day cells skip the fuzzy dateutil parse)
+        current_year = now.year
+        parsed_date = _fast_date(date_text, current_year)
         try:
-            current_year = datetime.now().year
-            parsed_date = dtp.parse(date_text, fuzzy=True)
+            if parsed_date is None:
+                parsed_date = _parse_date_cached(date_text, _midnight(now))
             
             # Default to 7 PM if no time
             if parsed_date.hour == 0 and parsed_date.minute == 0:
                 parsed_date = parsed_date.replace(hour=19, minute=0)
-        except:
+        except (ValueError, OverflowError):
             # Try manual parsing for formats like "Sep 2"
             try:
                 # Look for month name and day
-                month_map = {
-                    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                }
                 parts = date_text.lower().strip().split()
                 if len(parts) >= 2:
                     month_str = parts[0][:3]
-                    day = int(re.search(r'\d+', parts[1]).group())
-                    month = month_map.get(month_str, datetime.now().month)
+                    day = int(_DIGITS_RE.search(parts[1]).group())
+                    month = _MONTH_MAP.get(month_str, now.month)
                     parsed_date = datetime(current_year, month, day, 19, 0)
                 else:
                     return None
-            except:
+            except (ValueError, AttributeError):
                 return None
         
-        # Determine location and title based on sport
-        if sport_type == "football":
-            location = "Vaught-Hemingway Stadium"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = "Football"
-        elif "basketball" in sport_type.lower():
-            location = "The Pavilion"
-            # Determine if men's or women's basketball based on sport_type or source
-            sport_type_lower = sport_type.lower()
-            source_lower = source_name.lower()
-            if "women" in sport_type_lower or "wbb" in sport_type_lower or "women" in source_lower:
-                title = f"Ole Miss Women's Basketball vs {opponent_clean}"
-                sport_desc = "Women's Basketball"
-            elif "men" in sport_type_lower or "mbb" in sport_type_lower or "men" in source_lower:
-                title = f"Ole Miss Men's Basketball vs {opponent_clean}"
-                sport_desc = "Men's Basketball"
-            else:
-                # Default based on URL
-                if "womens" in base_url.lower() or "women" in base_url.lower():
-                    title = f"Ole Miss Women's Basketball vs {opponent_clean}"
-                    sport_desc = "Women's Basketball"
-                else:
-                    title = f"Ole Miss Men's Basketball vs {opponent_clean}"
-                    sport_desc = "Men's Basketball"
-        elif sport_type == "baseball":
-            location = "Swayze Field"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = "Baseball"
-        elif sport_type == "softball":
-            location = "Ole Miss Softball Complex"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = "Softball"
-        elif sport_type == "volleyball":
-            location = "The Pavilion"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = "Volleyball"
-        else:
-            location = "TBD"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = sport_type.title()
-        
+        title_head, desc_head, base = template or _event_template(sport_type, source_name, base_url)
         return {
-            "title": title,
+            "title": title_head + opponent_clean,
             "start_iso": parsed_date.isoformat(),
-            "location": location,
-            "description": f"{sport_desc} game: {title}",
-            "category": "Ole Miss Athletics",
-            "source": source_name,
-            "link": base_url,
-            "cost": "Varies"
+            "description": desc_head + opponent_clean,
+            **base,
         }
     except Exception as e:
         print(f"[Ole Miss Athletics] Error parsing table row: {e}")
         return None
 
 
-def _parse_game_element(elem, source_name: str, sport_type: str, base_url: str, seen_games: set) -> Dict[str, Any]:
-    """Parse a game element (div/article) to extract game information"""
+@lru_cache(maxsize=2048)
+def _parse_date_cached(date_text: str, default: datetime) -> datetime:
+    """
+    Fuzzy dateutil parse, memoized since schedule pages repeat the same date strings
+    `default` fills in missing fields (normally today at midnight) and is part of the key,
+    so cached results never carry a stale year across days
+    """
+    return dtp.parse(date_text, fuzzy=True, default=default)
+
+
+def _midnight(now: Optional[datetime] = None) -> datetime:
+    """Today at 00:00, the same default dateutil uses when none is given"""
+    return (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _fast_date(date_text: str, year: int) -> Optional[datetime]:
+    """
+    Parse a plain "Sep 13" / "11/08" date (optionally with a year) at midnight, or None if it has any other shape
+    `year` is used when the text doesn't carry one
+    """
+    match = _FAST_DATE_RE.match(date_text)
+    if not match:
+        return None
+    month_name, day, text_year, month_num, day_num, numeric_year = match.groups()
+    try:
+        if month_name:
+            if text_year:
+                year = int(text_year)
+            return datetime(year, _MONTH_MAP.get(month_name) or _MONTH_MAP[month_name.lower()], int(day))
+        if numeric_year:
+            year = int(numeric_year)
+            if year < 100:
+                year += 2000
+        return datetime(year, int(month_num), int(day_num))
+    except ValueError:
+        return None
+
+
+def _parse_game_element(elem, source_name: str, sport_type: str, base_url: str, seen_games: set,
+                        now: Optional[datetime] = None,
+                        template: Optional[Tuple[str, str, Dict[str, str]]] = None) -> Dict[str, Any]:
+    """
+    Parse a game element (div/article) to extract game information
+    `template` is the page's _event_template result, resolved once by the caller when given
+    """
+    if now is None:
+        now = datetime.now()
     try:
         text = elem.get_text(separator=' ', strip=True)
         if not text:
             return None
         
-        # Look for date pattern (e.g., "Nov 8", "Sep 13")
-        date_match = re.search(r'([A-Z][a-z]{2})\s+(\d{1,2})', text)
-        if not date_match:
+        # Cheap substring prescreen: both game patterns need a "vs"/"at" token
+        text_lower = text.lower()
+        if 'vs' not in text_lower and 'at' not in text_lower:
             return None
         
-        month_abbr, day = date_match.groups()
-        
         # Look for "vs" or "at" pattern - be more specific to avoid matching date patterns
         # First, try to find a clear "vs" followed by opponent name
-        game_match = re.search(r'\b(vs|at)\s+([A-Z#][A-Za-z\s&]+?)(?:\s*[,\n\(]|\s*$|Logo|Oxford|Miss\.)', text, re.IGNORECASE)
+        game_match = _GAME_MATCH_RE.search(text)
         if not game_match:
             # Fallback to simpler pattern
-            game_match = re.search(r'(vs|at)\s+([A-Z#][^,\n\(]+)', text, re.IGNORECASE)
+            game_match = _GAME_MATCH_FALLBACK_RE.search(text)
         
         if not game_match:
             return None
         
         game_type, opponent_raw = game_match.groups()
         
-        # Skip away games
+        # Skip away games before any date parsing or opponent cleanup
         if game_type.lower() == 'at':
             return None
         
-        # Clean opponent name (remove extra info like logos, rankings, locations, dates/times)
-        opponent_clean = opponent_raw.strip()
+        # Look for date pattern (e.g., "Nov 8", "Sep 13")
+        date_match = _MONTH_DAY_RE.search(text)
+        if not date_match:
+            return None
+        
+        month_abbr, day = date_match.groups()
         
-        # Remove date/time patterns that got included in opponent - patterns like:
+        # Cheap first-level dedup on the raw match before any cleanup work; nested
+        # calendar items often repeat the same game text. Tuple keys share the
+        # set with the cleaned string keys below without colliding.
+        raw_key = (month_abbr.lower(), day, opponent_raw.strip())
+        if raw_key in seen_games:
+            return None
+        seen_games.add(raw_key)
+        
+        # Clean opponent name (remove extra info like logos, rankings, locations, dates/times)
         # "Nov 15 / 2:30-3:30 or 5-7 PM vs Florida" -> should extract just "Florida"
         # "Nov 08 / Noon vs The Citadel" -> should extract just "The Citadel"
-        # Strategy: Find the last "vs" after a date pattern and extract what follows
-        # First, try to remove everything from date pattern up to and including the next "vs"
-        opponent_clean = re.sub(r'[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*[^vs]+?\s+vs\s+', '', opponent_clean, flags=re.IGNORECASE)
-        opponent_clean = re.sub(r'\s*[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*[^A-Z]+?vs\s+', '', opponent_clean, flags=re.IGNORECASE)
-        # Remove standalone date patterns
-        opponent_clean = re.sub(r'\s*[A-Z][a-z]{2}\s+\d{1,2}\s*/\s*(Noon|\d{1,2}\s*[AP]M|\d{1,2}:\d{2}[^\s]*?)', '', opponent_clean, flags=re.IGNORECASE)
-        opponent_clean = re.sub(r'\s*/\s*(Noon|\d{1,2}\s*[AP]M|\d{1,2}:\d{2}[^\s]*?\s*(or|PM|AM|pm|am))', '', opponent_clean, flags=re.IGNORECASE)
-        opponent_clean = re.sub(r'\s*\d{1,2}/\d{1,2}\s*/\s*(Noon|\d{1,2}\s*[AP]M)', '', opponent_clean, flags=re.IGNORECASE)
-        # Remove "vs" if it appears at the start (duplicate)
-        opponent_clean = re.sub(r'^\s*(vs|VS)\s+', '', opponent_clean, flags=re.IGNORECASE)
-        # Remove other patterns
-        opponent_clean = re.sub(r'^(#?\d+\s+)?', '', opponent_clean)
-        opponent_clean = re.sub(r'\s+Logo.*$', '', opponent_clean, flags=re.IGNORECASE)
-        opponent_clean = re.sub(r'\s+Oxford.*$', '', opponent_clean, flags=re.IGNORECASE)
-        opponent_clean = re.sub(r'\s+Miss\..*$', '', opponent_clean, flags=re.IGNORECASE)
-        opponent_clean = opponent_clean.strip()
+        opponent_clean = _OPP_NOISE_RE.sub('', opponent_raw.strip())
+        # Remove a duplicate leading "vs" and ranking, then trailing logo/location text
+        opponent_clean = _OPP_PREFIX_RE.sub('', opponent_clean, count=1)
+        opponent_clean = _OPP_LOGO_TAIL_RE.sub('', opponent_clean).strip()
         
         if not opponent_clean or len(opponent_clean) < 2:
             return None
@@ -382,93 +571,44 @@ def _parse_game_element(elem, source_name: str, sport_type: str, base_url: str,
         seen_games.add(game_key)
         
         # Parse date
-        month_map = {
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-            'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
-        month = month_map.get(month_abbr.lower()[:3])
+        month = _MONTH_MAP.get(month_abbr)
         if not month:
             return None
         
         day_int = int(day)
-        current_year = datetime.now().year
+        current_year = now.year
         
         # Parse time if available (look for patterns like "Noon", "7 p.m.", "2:30-3:30 or 5-7 PM")
-        time_match = re.search(r'(Noon|12\s*[Pp][Mm]|(\d{1,2}):?(\d{2})?\s*([AaPp][Mm])|(\d{1,2})\s*([Pp][Mm]))', text, re.IGNORECASE)
+        time_match = _TIME_RE.search(text)
         hour = 19  # Default 7 PM
         minute = 0
         
         if time_match:
-            time_str = time_match.group(0).lower()
-            if 'noon' in time_str or '12' in time_str:
-                hour = 12
-                minute = 0
+            # The match groups already split out the hour and am/pm, so no second scan is needed
+            _, clock_hour, _, meridiem, bare_hour, _ = time_match.groups()
+            hour_text = clock_hour or bare_hour
+            if hour_text is None:
+                hour = 12  # "Noon" / "12 PM"
             else:
-                # Try to extract hour
-                hour_match = re.search(r'(\d{1,2})', time_str)
-                if hour_match:
-                    hour = int(hour_match.group(1))
-                    if 'pm' in time_str and hour < 12:
+                hour = int(hour_text)
+                if clock_hour is None or meridiem.lower() == 'pm':
+                    if hour < 12:
                         hour += 12
-                    elif 'am' in time_str and hour == 12:
-                        hour = 0
+                elif hour == 12:
+                    hour = 0
         
         parsed_date = datetime(current_year, month, day_int, hour, minute)
         
         # If date has passed this year, assume next year
-        if parsed_date < datetime.now():
+        if parsed_date < now:
             parsed_date = datetime(current_year + 1, month, day_int, hour, minute)
         
-        # Determine location and build title with sport description
-        if sport_type == "football":
-            location = "Vaught-Hemingway Stadium"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = "Football"
-        elif "basketball" in sport_type.lower():
-            location = "The Pavilion"
-            # Determine if men's or women's basketball based on sport_type or source
-            sport_type_lower = sport_type.lower()
-            source_lower = source_name.lower()
-            if "women" in sport_type_lower or "wbb" in sport_type_lower or "women" in source_lower:
-                title = f"Ole Miss Women's Basketball vs {opponent_clean}"
-                sport_desc = "Women's Basketball"
-            elif "men" in sport_type_lower or "mbb" in sport_type_lower or "men" in source_lower:
-                title = f"Ole Miss Men's Basketball vs {opponent_clean}"
-                sport_desc = "Men's Basketball"
-            else:
-                # Default based on URL
-                if "womens" in base_url.lower() or "women" in base_url.lower():
-                    title = f"Ole Miss Women's Basketball vs {opponent_clean}"
-                    sport_desc = "Women's Basketball"
-                else:
-                    title = f"Ole Miss Men's Basketball vs {opponent_clean}"
-                    sport_desc = "Men's Basketball"
-        elif sport_type == "baseball":
-            location = "Swayze Field"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = "Baseball"
-        elif sport_type == "softball":
-            location = "Ole Miss Softball Complex"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = "Softball"
-        elif sport_type == "volleyball":
-            location = "The Pavilion"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = "Volleyball"
-        else:
-            location = "TBD"
-            title = f"Ole Miss vs {opponent_clean}"
-            sport_desc = sport_type.title()
-        
+        title_head, desc_head, base = template or _event_template(sport_type, source_name, base_url)
         return {
-            "title": title,
+            "title": title_head + opponent_clean,
             "start_iso": parsed_date.isoformat(),
-            "location": location,
-            "description": f"{sport_desc} game: {title}",
-            "category": "Ole Miss Athletics",
-            "source": source_name,
-            "link": base_url,
-            "cost": "Varies"
+            "description": desc_head + opponent_clean,
+            **base,
         }
     except Exception as e:
         print(f"[Ole Miss Athletics] Error parsing game element: {e}")
@@ -482,59 +622,45 @@ def _parse_schedule_item(item, source_name: str, sport_type: str, base_url: str)
         if not text:
             return None
         
+        # Skip away games
+        text_lower = text.lower()
+        if text_lower.startswith('@') or ' at ' in text_lower:
+            return None
+        
         # Look for date pattern
-        date_match = re.search(r'(\w+\s+\d+|\d+/\d+)', text)
+        date_match = _ITEM_DATE_RE.search(text)
         if not date_match:
             return None
         
         date_text = date_match.group(1)
         
         # Look for opponent (usually after date, skip @ or "at")
-        opponent_match = re.search(r'(?:vs|@|at)\s+([A-Z][^,\n]+)', text, re.IGNORECASE)
+        opponent_match = _ITEM_OPPONENT_RE.search(text)
         if not opponent_match:
             return None
         
         opponent_text = opponent_match.group(1).strip()
         
-        # Skip away games
-        if text.lower().startswith('@') or ' at ' in text.lower():
-            return None
-        
         # Parse date
         try:
-            current_year = datetime.now().year
-            parsed_date = dtp.parse(date_text, fuzzy=True)
+            now = datetime.now()
+            parsed_date = _fast_date(date_text, now.year) or _parse_date_cached(date_text, _midnight(now))
             if parsed_date.hour == 0:
                 parsed_date = parsed_date.replace(hour=19, minute=0)
-        except:
+        except (ValueError, OverflowError):
             return None
         
-        # Determine location
-        if sport_type == "football":
-            location = "Vaught-Hemingway Stadium"
-        elif "basketball" in sport_type.lower():
-            location = "The Pavilion"
-        elif sport_type == "baseball":
-            location = "Swayze Field"
-        elif sport_type == "softball":
-            location = "Ole Miss Softball Complex"
-        elif sport_type == "volleyball":
-            location = "The Pavilion"
-        else:
-            location = "TBD"
+        # Location/category/source/link/cost are shared with every other game on the page
+        base = _event_template(sport_type, source_name, base_url)[2]
         
         title = f"Ole Miss vs {opponent_text}"
         
         return {
             "title": title,
             "start_iso": parsed_date.isoformat(),
-            "location": location,
             "description": f"{sport_type.title()} game: {title}",
-            "category": "Ole Miss Athletics",
-            "source": source_name,
-            "link": base_url,
-            "cost": "Varies"
+            **base,
         }
-    except:
+    except (AttributeError, TypeError, ValueError):
         return None
 
@@ -3,19 +3,19 @@ Status tracking for event loading progress
 Provides human-readable status updates for the frontend
 """
 
-import threading
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-# Global status tracker (thread-safe)
-_status_lock = threading.Lock()
-_current_status: Optional[Dict] = None
+# Global status snapshot: an immutable (step, total_steps, message, details, timestamp) tuple,
+# or None once loading is complete. Writers swap in a new tuple and readers take one
+# reference to it; both are single atomic operations in CPython, so no lock is needed.
+_current_status: Optional[Tuple[int, int, str, str, str]] = None
 
 
 def set_status(step: int, total_steps: int, message: str, details: str = ""):
     """
     Set the current loading status
-    
+
     Args:
         step: Current step number (1-based)
         total_steps: Total number of steps
@@ -23,28 +23,26 @@ def set_status(step: int, total_steps: int, message: str, details: str = ""):
         details: Additional details (optional)
     """
     global _current_status
-    with _status_lock:
-        _current_status = {
-            "status": "loading",
-            "step": step,
-            "total_steps": total_steps,
-            "message": message,
-            "details": details,
-            "timestamp": datetime.now().isoformat()
-        }
+    _current_status = (step, total_steps, message, details, datetime.now().isoformat())
 
 
 def get_status() -> Optional[Dict]:
     """Get the current status"""
-    with _status_lock:
-        if _current_status:
-            return _current_status.copy()
+    snapshot = _current_status
+    if snapshot is None:
         return {"status": "complete", "step": 0, "total_steps": 0, "message": "Loading complete", "details": ""}
+    step, total_steps, message, details, timestamp = snapshot
+    return {
+        "status": "loading",
+        "step": step,
+        "total_steps": total_steps,
+        "message": message,
+        "details": details,
+        "timestamp": timestamp
+    }
 
 
 def clear_status():
     """Clear the status (when loading is complete)"""
     global _current_status
-    with _status_lock:
-        _current_status = {"status": "complete", "step": 0, "total_steps": 0, "message": "Loading complete", "details": ""}
-
+    _current_status = None
@@ -3,12 +3,92 @@ Enhanced scraper for Visit Oxford events page
 Follows event links to get full details without Selenium
 """
 
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Union
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from dateutil import parser as dtp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from lib.http_cache import conditional_headers, cached_payload, store_payload, flush_cache
+
+try:
+    # orjson decodes the multi-KB JSON-LD blocks several times faster when it's installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Cap on parsed events per run, and how many detail pages are fetched at once
+# (every detail page is on the same host, so keep the per-host concurrency small)
+MAX_EVENTS = 30
+MAX_DETAIL_WORKERS = 3
+
+# Cached detail pages carry the parser version, and are only revalidated for an hour since
+# dates without a year or day are resolved against today's date
+PARSER_VERSION = 1
+DETAIL_CACHE_MAX_AGE = 3600
+
+# Shared keep-alive session: the listing page and every detail page reuse pooled connections
+_SESSION = requests.Session()
+# Quick retries for connect failures and transient 5xx; read timeouts are not retried
+_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({'GET'}),
+    raise_on_status=False,
+)
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRY))
+_SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRY))
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+})
+
+# Ole Miss athletics mentions, and the matchup wording that marks an actual game listing
+_ATHLETIC_KEYWORD_RE = re.compile(r'ole miss|rebels|football|basketball|baseball', re.IGNORECASE)
+_ATHLETIC_MATCHUP_RE = re.compile(r' vs\.? | game| matchup| schedule', re.IGNORECASE)
+
+# CSS selectors compiled once with soupsieve (the engine behind soup.select) and tried in order
+_EVENT_LINK_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'a.elementor-post__thumbnail__link',
+    '.event-card a',
+    '.tribe-events-widget-events-list__event-title a',
+    '.tribe-events-calendar-list__event-title a',
+    'article a',
+    'a[href*="/event/"]',
+    'a[href*="/events/"]',
+))
+_TITLE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'h1', 'h2.event-title', '.event-title', '.event-name', 'title'
+))
+_DATE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    '.event-date', '.date', '[class*="date"]',
+    'time', '[datetime]', '.event-time', '.event-datetime'
+))
+_LOCATION_SELECTORS = tuple(sv.compile(selector) for selector in (
+    '.event-location', '.venue', '.location',
+    '[class*="location"]', '[class*="venue"]', '.event-venue'
+))
+_DESCRIPTION_SELECTORS = tuple(sv.compile(selector) for selector in (
+    '.event-description', '.description', '[class*="description"]',
+    '.event-details', '.content', '.event-content'
+))
+
+# Script type of JSON-LD blocks, searched for in the raw detail page bytes
+_LD_JSON_MARKER = b'application/ld+json'
+_LD_JSON_ONLY = SoupStrainer('script', attrs={'type': 'application/ld+json'})
 
 
 def fetch_visit_oxford_events(url: str, source_name: str) -> List[Dict[str, Any]]:
@@ -19,20 +99,14 @@ def fetch_visit_oxford_events(url: str, source_name: str) -> List[Dict[str, Any]
     events = []
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-        
         print(f"[Visit Oxford] Loading main page: {url}")
-        response = requests.get(url, timeout=10, headers=headers)
+        response = _SESSION.get(url, timeout=10)
         
         if response.status_code != 200:
             print(f"[Visit Oxford] Error: Got status code {response.status_code}")
             return events
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Find all event links
         event_links = _extract_event_links(soup, url)
@@ -42,75 +116,22 @@ def fetch_visit_oxford_events(url: str, source_name: str) -> List[Dict[str, Any]
             print("[Visit Oxford] No event links found on main page.")
             return events
         
-        MAX_EVENTS = 30
-        processed = 0
+        # Detail pages are fetched concurrently, in batches sized to the events still
+        # needed; results are consumed in link order so the same events win as before
+        next_idx = 0
+        with ThreadPoolExecutor(max_workers=MAX_DETAIL_WORKERS) as executor:
+            while len(events) < MAX_EVENTS and next_idx < len(event_links):
+                batch = event_links[next_idx:next_idx + MAX_EVENTS - len(events)]
+                next_idx += len(batch)
+                for event in executor.map(lambda link: _fetch_event(link, source_name), batch):
+                    if event:
+                        events.append(event)
+
+        # Detail pages only update the HTTP cache in memory; write it once per run
+        flush_cache()
         
-        for idx, event_link in enumerate(event_links):
-            if processed >= MAX_EVENTS:
-                print(f"[Visit Oxford] Reached max events ({MAX_EVENTS}) to prevent timeout.")
-                break
-            try:
-                href = event_link['href']
-                print(f"[Visit Oxford] Processing event {idx + 1}/{len(event_links)}: {href}")
-                
-                # Fetch event detail page with short timeout
-                try:
-                    detail_response = requests.get(href, timeout=5, headers=headers)
-                    if detail_response.status_code != 200:
-                        print(f"[Visit Oxford] Skipping {href} - status {detail_response.status_code}")
-                        continue
-                except requests.exceptions.Timeout:
-                    print(f"[Visit Oxford] Timeout fetching {href}, skipping")
-                    continue
-                except requests.exceptions.RequestException as e:
-                    print(f"[Visit Oxford] Error fetching {href}: {e}")
-                    continue
-                
-                detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-                
-                event_payload = _parse_event_detail(detail_soup, event_link)
-                
-                if not event_payload:
-                    print(f"[Visit Oxford] Skipping {href} - could not parse required fields.")
-                    continue
-                
-                title = event_payload["title"]
-                start_iso = event_payload["start_iso"]
-                location = event_payload["location"]
-                description = event_payload["description"]
-                cost = event_payload.get("cost", "Free")
-                
-                # Check if this is an Ole Miss Athletic event (filter out duplicates)
-                title_lower = title.lower()
-                description_lower = description.lower()
-                if any(keyword in title_lower or keyword in description_lower 
-                       for keyword in ['ole miss', 'rebels', 'football', 'basketball', 'baseball']):
-                    # Check if it's actually an athletic event vs just mentioning Ole Miss
-                    if any(sport in title_lower for sport in [' vs ', ' vs. ', ' game', ' matchup', ' schedule']):
-                        print(f"[Visit Oxford] Skipping duplicate athletic event: {title}")
-                        continue
-                
-                event = {
-                    "title": title,
-                    "start_iso": start_iso,
-                    "location": location,
-                    "description": description,
-                    "category": "Community",  # Will be recategorized by categorizer
-                    "source": source_name,
-                    "link": href,
-                    "cost": cost or "Free"
-                }
-                
-                events.append(event)
-                processed += 1
-                print(f"[Visit Oxford] Successfully parsed: {title}")
-                
-                if processed % 5 == 0:
-                    time.sleep(0.2)
-                
-            except Exception as e:
-                print(f"[Visit Oxford] Error processing event {href}: {e}")
-                continue
+        if len(events) >= MAX_EVENTS:
+            print(f"[Visit Oxford] Reached max events ({MAX_EVENTS}) to prevent timeout.")
         
         print(f"[Visit Oxford] Successfully scraped {len(events)} events")
             
@@ -122,22 +143,78 @@ def fetch_visit_oxford_events(url: str, source_name: str) -> List[Dict[str, Any]
     return events
 
 
+def _fetch_event(event_link: Dict[str, str], source_name: str) -> Optional[Dict[str, Any]]:
+    """Fetch and parse one event detail page; returns None if it should be skipped"""
+    href = event_link['href']
+    try:
+        print(f"[Visit Oxford] Processing event: {href}")
+        
+        # Fetch event detail page with short timeout, revalidating the last parsed copy;
+        # a 304 skips both the download and the parse
+        try:
+            detail_response = _SESSION.get(href, timeout=5, headers=conditional_headers(href, PARSER_VERSION, DETAIL_CACHE_MAX_AGE))
+            if detail_response.status_code == 304:
+                cached = cached_payload(href, PARSER_VERSION, DETAIL_CACHE_MAX_AGE)
+                if cached is not None:
+                    return cached  # already a private copy
+            if detail_response.status_code != 200:
+                print(f"[Visit Oxford] Skipping {href} - status {detail_response.status_code}")
+                return None
+        except requests.exceptions.Timeout:
+            print(f"[Visit Oxford] Timeout fetching {href}, skipping")
+            return None
+        except requests.exceptions.RequestException as e:
+            print(f"[Visit Oxford] Error fetching {href}: {e}")
+            return None
+        
+        event_payload = _parse_event_detail(None, event_link, raw_html=detail_response.content)
+        
+        if not event_payload:
+            print(f"[Visit Oxford] Skipping {href} - could not parse required fields.")
+            return None
+        
+        title = event_payload["title"]
+        start_iso = event_payload["start_iso"]
+        location = event_payload["location"]
+        description = event_payload["description"]
+        cost = event_payload.get("cost", "Free")
+        
+        # Check if this is an Ole Miss Athletic event (filter out duplicates)
+        if _ATHLETIC_KEYWORD_RE.search(title) or _ATHLETIC_KEYWORD_RE.search(description):
+            # Check if it's actually an athletic event vs just mentioning Ole Miss
+            if _ATHLETIC_MATCHUP_RE.search(title):
+                print(f"[Visit Oxford] Skipping duplicate athletic event: {title}")
+                return None
+        
+        print(f"[Visit Oxford] Successfully parsed: {title}")
+        event = {
+            "title": title,
+            "start_iso": start_iso,
+            "location": location,
+            "description": description,
+            "category": "Community",  # Will be recategorized by categorizer
+            "source": source_name,
+            "link": href,
+            "cost": cost or "Free"
+        }
+        # A cache failure must never cost us an event that parsed fine
+        try:
+            store_payload(href, detail_response.headers, event, version=PARSER_VERSION)
+        except Exception as e:
+            print(f"[Visit Oxford] Could not cache {href}: {e}")
+        return event
+        
+    except Exception as e:
+        print(f"[Visit Oxford] Error processing event {href}: {e}")
+        return None
+
+
 def _extract_event_links(soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
     links = []
     seen = set()
 
-    candidate_selectors = [
-        'a.elementor-post__thumbnail__link',
-        '.event-card a',
-        '.tribe-events-widget-events-list__event-title a',
-        '.tribe-events-calendar-list__event-title a',
-        'article a',
-        'a[href*="/event/"]',
-        'a[href*="/events/"]',
-    ]
-
-    for selector in candidate_selectors:
-        for anchor in soup.select(selector):
+    for selector in _EVENT_LINK_SELECTORS:
+        for anchor in selector.select(soup):
             href = anchor.get('href')
             if not href:
                 continue
@@ -156,17 +233,46 @@ def _extract_event_links(soup: BeautifulSoup, base_url: str) -> List[Dict[str, s
 def _normalize_link(href: str, base_url: str) -> Optional[str]:
     if href.startswith(('mailto:', 'tel:')):
         return None
-    if href.startswith('/'):
-        return base_url.rstrip('/') + href
     if href.startswith('http'):
         return href
-    return base_url.rstrip('/') + '/' + href
+    # Root-relative links resolve against the site root, not the listing page's path
+    return urljoin(base_url, href)
+
+
+@lru_cache(maxsize=512)
+def _parse_date_iso(date_str: str, default: datetime) -> Optional[str]:
+    """
+    dateutil parse to an ISO string, memoized since series and weekly shows repeat the same dates
+    `default` (today at midnight) fills in missing fields and is part of the key, so results don't go stale across days
+    """
+    try:
+        return dtp.parse(date_str, default=default).isoformat()
+    except (ValueError, OverflowError):
+        return None
+
 
+def _midnight() -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
-def _parse_event_detail(detail_soup: BeautifulSoup, event_link: Dict[str, str]) -> Optional[Dict[str, Union[str, None]]]:
-    payload = _parse_ld_json(detail_soup)
 
+def _parse_event_detail(detail_soup: Optional[BeautifulSoup], event_link: Dict[str, str],
+                        raw_html: Optional[bytes] = None) -> Optional[Dict[str, Union[str, None]]]:
+    """
+    Parse a detail page from an already-built soup or, when raw_html is given, from the raw bytes
+    (detail_soup may then be None and is only built if the selector fallback needs it)
+    """
+    payload = None
+    if raw_html is None:
+        payload = _parse_ld_json(detail_soup)
+    elif _LD_JSON_MARKER in raw_html:
+        # A byte scan of the raw page is cheaper than walking every <script> when there's no
+        # JSON-LD; when there is, only the JSON-LD scripts are built into a tree
+        payload = _parse_ld_json(BeautifulSoup(raw_html, 'lxml', parse_only=_LD_JSON_ONLY))
+
+    # The full page tree is only needed for the selector fallback
     if payload is None:
+        if detail_soup is None:
+            detail_soup = BeautifulSoup(raw_html, 'lxml')
         payload = _parse_event_fallback(detail_soup, event_link)
 
     if payload and payload.get("start_iso"):
@@ -179,8 +285,8 @@ def _parse_ld_json(detail_soup: BeautifulSoup) -> Optional[Dict[str, Union[str,
     scripts = detail_soup.find_all('script', type='application/ld+json')
     for script in scripts:
         try:
-            data = json.loads(script.string)
-        except (json.JSONDecodeError, TypeError):
+            data = _json_loads(script.string)
+        except (ValueError, TypeError):
             continue
 
         data_items = data if isinstance(data, list) else [data]
@@ -210,12 +316,7 @@ def _parse_ld_json(detail_soup: BeautifulSoup) -> Optional[Dict[str, Union[str,
                 if price:
                     cost = f"{currency} {price}".strip()
 
-            start_iso = None
-            if start:
-                try:
-                    start_iso = dtp.parse(start).isoformat()
-                except Exception:
-                    start_iso = None
+            start_iso = _parse_date_iso(start, _midnight()) if isinstance(start, str) and start else None
 
             if not start_iso:
                 continue
@@ -231,11 +332,38 @@ def _parse_ld_json(detail_soup: BeautifulSoup) -> Optional[Dict[str, Union[str,
     return None
 
 
+def _text_prefix(elem, limit: int) -> str:
+    """
+    Same as elem.get_text(strip=True)[:limit], but stops walking the subtree once
+    `limit` characters are collected instead of joining the whole description
+    """
+    parts = []
+    length = 0
+    for text in elem.stripped_strings:
+        parts.append(text)
+        length += len(text)
+        if length >= limit:
+            break
+    return ''.join(parts)[:limit]
+
+
 def _parse_event_fallback(detail_soup: BeautifulSoup, event_link: Dict[str, str]) -> Optional[Dict[str, Union[str, None]]]:
+    date_str = None
+    for selector in _DATE_SELECTORS:
+        date_elem = selector.select_one(detail_soup)
+        if date_elem:
+            date_str = date_elem.get('datetime') or date_elem.get('content') or date_elem.get_text(strip=True)
+            if date_str:
+                break
+
+    # Without a usable date the event is dropped, so check it before extracting any other text
+    start_iso = _parse_date_iso(date_str, _midnight()) if date_str else None
+    if not start_iso:
+        return None
+
     title = None
-    title_selectors = ['h1', 'h2.event-title', '.event-title', '.event-name', 'title']
-    for selector in title_selectors:
-        title_elem = detail_soup.select_one(selector)
+    for selector in _TITLE_SELECTORS:
+        title_elem = selector.select_one(detail_soup)
         if title_elem:
             title = title_elem.get_text(strip=True)
             if title and len(title) > 3:
@@ -244,53 +372,22 @@ def _parse_event_fallback(detail_soup: BeautifulSoup, event_link: Dict[str, str]
     if not title:
         title = event_link.get('text') or 'Untitled Event'
 
-    date_str = None
-    date_selectors = [
-        '.event-date', '.date', '[class*="date"]',
-        'time', '[datetime]', '.event-time', '.event-datetime'
-    ]
-    for selector in date_selectors:
-        date_elem = detail_soup.select_one(selector)
-        if date_elem:
-            date_str = date_elem.get('datetime') or date_elem.get('content') or date_elem.get_text(strip=True)
-            if date_str:
-                break
-
     location = 'Oxford, MS'
-    location_selectors = [
-        '.event-location', '.venue', '.location',
-        '[class*="location"]', '[class*="venue"]', '.event-venue'
-    ]
-    for selector in location_selectors:
-        loc_elem = detail_soup.select_one(selector)
+    for selector in _LOCATION_SELECTORS:
+        loc_elem = selector.select_one(detail_soup)
         if loc_elem:
             location = loc_elem.get_text(strip=True)
             if location:
                 break
 
     description = ''
-    desc_selectors = [
-        '.event-description', '.description', '[class*="description"]',
-        '.event-details', '.content', '.event-content'
-    ]
-    for selector in desc_selectors:
-        desc_elem = detail_soup.select_one(selector)
+    for selector in _DESCRIPTION_SELECTORS:
+        desc_elem = selector.select_one(detail_soup)
         if desc_elem:
-            description = desc_elem.get_text(strip=True)[:500]
+            description = _text_prefix(desc_elem, 500)
             if description:
                 break
 
-    start_iso = None
-    if date_str:
-        try:
-            parsed_date = dtp.parse(date_str)
-            start_iso = parsed_date.isoformat()
-        except Exception:
-            start_iso = None
-
-    if not start_iso:
-        return None
-
     return {
         "title": title,
         "start_iso": start_iso,
@@ -4,11 +4,20 @@ Creates a local cache in static/images/ncaa-logos/
 """
 
 import os
+import shutil
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import re
+from requests.adapters import HTTPAdapter
+
+try:
+    # orjson serializes the mapping file much faster when it's installed
+    import orjson
+except ImportError:
+    orjson = None
 
 # Base URL for raw GitHub content
 BASE_URL = "https://raw.githubusercontent.com/klunn91/team-logos/master/NCAA"
@@ -21,19 +30,75 @@ CACHE_DIR.mkdir(parents=True, exist_ok=True)
 # Mapping file to store name variations
 MAPPING_FILE = Path("data/ncaa_team_mappings.json")
 
+# Last GitHub API listing with its validators, so unchanged listings can be revalidated (HTTP 304)
+FILE_LIST_CACHE = Path("data/ncaa_file_list.cache.json")
+
+# Logo downloads are small and latency bound, so fetch them concurrently
+# over one pooled session sized to the worker count
+MAX_DOWNLOAD_WORKERS = 32
+
+
+# Case-insensitive affixes stripped by normalize_team_name; each must be separated
+# from the rest of the name by whitespace
+_NAME_PREFIXES = ('university of', 'univ. of', 'univ of', 'u. of', 'u of')
+_NAME_SUFFIXES = ('university', 'univ.', 'univ')
+
+# Name cleanup patterns, compiled once (case-insensitivity inlined with (?i))
+_PREFIX_RE = re.compile(r'(?i)^(university of|univ\.? of|u\.? of)\s+')
+_THE_RE = re.compile(r'(?i)^the\s+')
+_SUFFIX_RE = re.compile(r'(?i)\s+(university|univ\.?)$')
+_PAREN_RE = re.compile(r'\s+\([^)]+\)$')
+_UNIVERSITY_OF_RE = re.compile(r'(?i)university of\s+')
+
 
 def normalize_team_name(name: str) -> str:
     """
     Normalize team name to match repository file naming conventions.
     Removes common prefixes/suffixes and standardizes format.
     """
+    lower = name.lower()
+    if len(lower) != len(name) or name.endswith('\n'):
+        # Lowercasing changed the length (rare non-ASCII), so indexes into lower don't line up;
+        # a trailing newline is matched specially by the regex '$'
+        return _normalize_team_name_re(name)
+    
     # Remove common prefixes
-    name = re.sub(r'^(university of|univ\.? of|u\.? of)\s+', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'^(the\s+)', '', name, flags=re.IGNORECASE)
+    for prefix in _NAME_PREFIXES:
+        if lower.startswith(prefix) and lower[len(prefix):len(prefix) + 1].isspace():
+            name = name[len(prefix):].lstrip()
+            lower = name.lower()
+            break
+    if lower.startswith('the') and lower[3:4].isspace():
+        name = name[3:].lstrip()
+        lower = name.lower()
     
     # Remove common suffixes
-    name = re.sub(r'\s+(university|univ\.?)$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s+\([^)]+\)$', '', name)  # Remove parenthetical info like "(D2)"
+    for suffix in _NAME_SUFFIXES:
+        if lower.endswith(suffix) and lower[-len(suffix) - 1:-len(suffix)].isspace():
+            name = name[:-len(suffix)].rstrip()
+            break
+    
+    # Remove parenthetical info like "(D2)": the first whitespace-preceded '(' after the last inner ')'
+    if name.endswith(')'):
+        open_idx = name.find('(', name.rfind(')', 0, -1) + 1)
+        while open_idx != -1 and not (open_idx > 0 and name[open_idx - 1].isspace()):
+            open_idx = name.find('(', open_idx + 1)
+        if open_idx != -1 and open_idx < len(name) - 2:
+            name = name[:open_idx].rstrip()
+    
+    # Clean up whitespace
+    return ' '.join(name.split())
+
+
+def _normalize_team_name_re(name: str) -> str:
+    """Regex form of normalize_team_name, used when the string scan can't be trusted"""
+    # Remove common prefixes
+    name = _PREFIX_RE.sub('', name)
+    name = _THE_RE.sub('', name)
+    
+    # Remove common suffixes
+    name = _SUFFIX_RE.sub('', name)
+    name = _PAREN_RE.sub('', name)  # Remove parenthetical info like "(D2)"
     
     # Clean up whitespace
     name = ' '.join(name.split())
@@ -41,27 +106,69 @@ def normalize_team_name(name: str) -> str:
     return name.strip()
 
 
+def _cached_get(url: str, cache_path: Path) -> Optional[list]:
+    """
+    GET a JSON resource, revalidating against the copy stored in cache_path.
+    Returns the cached body on HTTP 304, the fresh body on 200 (and stores it), else None.
+    """
+    cached = {}
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    headers = {}
+    if 'body' in cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    response = requests.get(url, headers=headers, timeout=30)
+    if response.status_code == 304 and 'body' in cached:
+        return cached['body']
+    if response.status_code != 200:
+        print(f"Error fetching file list: {response.status_code}")
+        return None
+    
+    body = response.json()
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        os.makedirs(cache_path.parent, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'etag': etag, 'last_modified': last_modified, 'body': body}, f)
+    return body
+
+
 def get_repo_file_list() -> List[str]:
     """Get list of all files in the NCAA directory from GitHub API"""
     try:
-        response = requests.get(REPO_API_URL, timeout=30)
-        if response.status_code == 200:
-            files = response.json()
-            # Filter for image files only
-            image_files = [
-                f['name'] for f in files 
-                if f['type'] == 'file' and f['name'].lower().endswith(('.png', '.jpg', '.jpeg', '.svg'))
-            ]
-            return image_files
-        else:
-            print(f"Error fetching file list: {response.status_code}")
+        files = _cached_get(REPO_API_URL, FILE_LIST_CACHE)
+        if files is None:
             return []
+        # Filter for image files only
+        image_files = [
+            f['name'] for f in files 
+            if f['type'] == 'file' and f['name'].lower().endswith(('.png', '.jpg', '.jpeg', '.svg'))
+        ]
+        return image_files
     except Exception as e:
         print(f"Error fetching file list: {e}")
         return []
 
 
-def download_logo(filename: str) -> bool:
+def _make_session() -> requests.Session:
+    """Session whose connection pool can serve every download worker at once"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_DOWNLOAD_WORKERS, pool_maxsize=MAX_DOWNLOAD_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def download_logo(filename: str, session: requests.Session) -> bool:
     """Download a single logo file"""
     url = f"{BASE_URL}/{filename}"
     local_path = CACHE_DIR / filename
@@ -71,15 +178,19 @@ def download_logo(filename: str) -> bool:
         return True
     
     try:
-        response = requests.get(url, timeout=15)
-        if response.status_code == 200:
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
-            print(f"Downloaded: {filename}")
-            return True
-        else:
-            print(f"Failed to download {filename}: HTTP {response.status_code}")
-            return False
+        with session.get(url, timeout=15, stream=True) as response:
+            if response.status_code != 200:
+                print(f"Failed to download {filename}: HTTP {response.status_code}")
+                return False
+            # Stream straight to disk; write to a temp name first so an interrupted
+            # download never leaves a truncated logo that later runs would skip
+            response.raw.decode_content = True
+            tmp_path = local_path.with_name(local_path.name + '.part')
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=65536)
+            os.replace(tmp_path, local_path)
+        print(f"Downloaded: {filename}")
+        return True
     except Exception as e:
         print(f"Error downloading {filename}: {e}")
         return False
@@ -88,59 +199,63 @@ def download_logo(filename: str) -> bool:
 def create_team_mapping(filename: str) -> Dict[str, str]:
     """
     Create mapping variations for a team logo filename.
-    Returns a dict mapping various name forms to the filename.
+    Returns a dict mapping various lowercase name forms to the filename
+    (utils.ncaa_logos only looks names up lowercased, so mixed-case keys are never read).
     """
     # Remove extension
     base_name = filename.rsplit('.', 1)[0]
     
-    # Create variations
-    variations = {
-        base_name.lower(): filename,
-        base_name: filename,  # Original case
-        normalize_team_name(base_name).lower(): filename,
-    }
-    
-    # Add variations without "University of"
-    if "university of" in base_name.lower():
-        short_name = re.sub(r'university of\s+', '', base_name, flags=re.IGNORECASE).strip()
-        variations[short_name.lower()] = filename
-        variations[short_name] = filename
-    
-    # Add variations with "University of"
-    if "university of" not in base_name.lower() and not base_name.lower().startswith("u "):
-        long_name = f"University of {base_name}"
-        variations[long_name.lower()] = filename
-        variations[long_name] = filename
+    lower = base_name.lower()
+    
+    # Create variations; forms that collapse onto one already added are just overwritten
+    variations = {lower: filename}
+    variations[normalize_team_name(base_name).lower()] = filename
+    
+    starts_with_u = lower.startswith("u ")
+    if "university of" in lower:
+        # Add variations without "University of"
+        variations[_UNIVERSITY_OF_RE.sub('', lower).strip()] = filename
+    elif not starts_with_u:
+        # Add variations with "University of"
+        variations[f"university of {lower}"] = filename
     
     # Handle common abbreviations (e.g., "U of Alabama" -> "Alabama")
-    if base_name.lower().startswith("u "):
-        short_name = base_name[2:].strip()
-        variations[short_name.lower()] = filename
-        variations[short_name] = filename
+    if starts_with_u:
+        variations[lower[2:].strip()] = filename
     
     return variations
 
 
 def build_team_mappings() -> Dict[str, str]:
-    """Build comprehensive team name mapping"""
-    mappings = {}
-    
+    """
+    Build comprehensive team name mapping
+    A logo's own name always wins; otherwise the first file to claim a derived name keeps it.
+    """
     # Get list of files
     files = get_repo_file_list()
     print(f"Found {len(files)} logo files in repository")
     
+    mappings = {filename.rsplit('.', 1)[0].lower(): filename for filename in files}
+    collisions = 0
     for filename in files:
-        file_variations = create_team_mapping(filename)
-        mappings.update(file_variations)
+        for key in create_team_mapping(filename):
+            owner = mappings.setdefault(key, filename)
+            if owner != filename:
+                collisions += 1
     
+    if collisions:
+        print(f"Skipped {collisions} name variations already claimed by another logo")
     return mappings
 
 
 def save_mappings(mappings: Dict[str, str]):
     """Save team name mappings to JSON file"""
     os.makedirs("data", exist_ok=True)
-    with open(MAPPING_FILE, 'w', encoding='utf-8') as f:
-        json.dump(mappings, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        MAPPING_FILE.write_bytes(orjson.dumps(mappings, option=orjson.OPT_INDENT_2))
+    else:
+        with open(MAPPING_FILE, 'w', encoding='utf-8') as f:
+            json.dump(mappings, f, indent=2, ensure_ascii=False)
     print(f"Saved {len(mappings)} team name mappings to {MAPPING_FILE}")
 
 
@@ -155,18 +270,16 @@ def download_all_logos():
     
     print(f"Found {len(files)} logo files. Downloading...")
     
-    downloaded = 0
-    skipped = 0
-    failed = 0
+    # One directory listing instead of a stat per file
+    cached = set(os.listdir(CACHE_DIR))
+    todo = [filename for filename in files if filename not in cached]
+    skipped = len(files) - len(todo)
     
-    for filename in files:
-        if download_logo(filename):
-            downloaded += 1
-        else:
-            if (CACHE_DIR / filename).exists():
-                skipped += 1
-            else:
-                failed += 1
+    with _make_session() as session, ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        results = list(executor.map(lambda filename: download_logo(filename, session), todo))
+    
+    downloaded = sum(results)
+    failed = len(results) - downloaded
     
     print(f"\nDownload complete:")
     print(f"  Downloaded: {downloaded}")
@@ -10,40 +10,67 @@ from __future__ import annotations
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in os.sys.path:
     os.sys.path.insert(0, str(PROJECT_ROOT))
 
-from lib.database import EventImage, get_session, init_database
+from sqlalchemy import inspect
+
+from lib.database import EventImage, get_engine, get_session, init_database
 from utils.storage import get_images_dir
 
+DELETE_BATCH_SIZE = 1000
+PURGE_WORKERS = 8
+
+
+def _remove_entry(entry: os.DirEntry) -> bool:
+    """Remove one cache entry (file, symlink or directory); return True if it was removed."""
+    try:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+        return True
+    except Exception as exc:  # pragma: no cover - log and continue
+        print(f"[reset_event_images] Failed to remove {entry.path}: {exc}")
+        return False
+
 
 def reset_event_images() -> tuple[int, int, str]:
     """Clear EventImage rows and delete cached image files."""
-    init_database()
-    session = get_session()
+    # create_all only matters on a fresh database; skip the DDL round-trips otherwise
+    if not inspect(get_engine()).has_table(EventImage.__tablename__):
+        init_database()
     deleted_rows = 0
-    try:
-        deleted_rows = session.query(EventImage).delete()
-        session.commit()
-    finally:
-        session.close()
+    with get_session() as session:
+        # Delete in bounded batches so each transaction stays small on a large table;
+        # session.begin() commits each batch, or rolls it back if it raises
+        while True:
+            with session.begin():
+                hashes = [
+                    row.event_hash
+                    for row in session.query(EventImage.event_hash).limit(DELETE_BATCH_SIZE)
+                ]
+                if hashes:
+                    session.query(EventImage).filter(
+                        EventImage.event_hash.in_(hashes)
+                    ).delete(synchronize_session=False)
+            if not hashes:
+                break
+            deleted_rows += len(hashes)
 
     images_dir = Path(get_images_dir())
     removed_files = 0
     if images_dir.exists():
-        for entry in images_dir.iterdir():
-            try:
-                if entry.is_file() or entry.is_symlink():
-                    entry.unlink()
-                    removed_files += 1
-                elif entry.is_dir():
-                    shutil.rmtree(entry)
-                    removed_files += 1
-            except Exception as exc:  # pragma: no cover - log and continue
-                print(f"[reset_event_images] Failed to remove {entry}: {exc}")
+        # The directory itself is kept (it may be a mounted persistent disk); its entries
+        # come from scandir, whose cached types avoid a stat per entry, and are removed in parallel
+        with os.scandir(images_dir) as it:
+            entries = list(it)
+        with ThreadPoolExecutor(max_workers=PURGE_WORKERS) as executor:
+            removed_files = sum(executor.map(_remove_entry, entries))
     return deleted_rows, removed_files, str(images_dir)
 
 
@@ -3,10 +3,13 @@ Main Streamlit application for Oxford Events
 """
 
 import streamlit as st
+from collections import defaultdict
 from datetime import datetime
+from dateutil import parser as dtp
+from typing import NamedTuple, Optional, Tuple
 from components.css import BANDSINTOWN_CSS
 from components.filters import render_filter_chips
-from components.event_card import render_event_card
+from components.event_card import render_event_grid_html
 from utils.filters import apply_all_filters
 from utils.image_processing import curl_test_url
 
@@ -22,34 +25,54 @@ st.set_option("client.showErrorDetails", True)
 # Apply CSS
 st.markdown(BANDSINTOWN_CSS, unsafe_allow_html=True)
 
-# Event sources
-EVENT_SOURCES = [
+
+class Source(NamedTuple):
+    """An event feed; only the fields its type needs are set"""
+    name: str
+    type: str
+    group: str
+    url: Optional[str] = None
+    parser: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    stateCode: Optional[str] = None
+
+
+# Event sources (immutable, so the count is fixed at import)
+EVENT_SOURCES: Tuple[Source, ...] = (
     # Ole Miss Athletics
-    {"name": "Ole Miss Football", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=football", "group": "University"},
-    {"name": "Ole Miss MBB", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=mbball", "group": "University"},
-    {"name": "Ole Miss WBB", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=wbball", "group": "University"},
-    {"name": "Ole Miss Baseball", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=baseball", "group": "University"},
-    {"name": "Ole Miss Softball", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=softball", "group": "University"},
-    {"name": "Ole Miss Track", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=track", "group": "University"},
-    {"name": "Ole Miss Soccer", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=soccer", "group": "University"},
-    {"name": "Ole Miss Volleyball", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=volleyball", "group": "University"},
-    {"name": "Ole Miss Tennis", "type": "ics", "url": "https://olemisssports.com/calendar.ashx/calendar.ics?path=tennis", "group": "University"},
+    Source(name="Ole Miss Football", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=football", group="University"),
+    Source(name="Ole Miss MBB", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=mbball", group="University"),
+    Source(name="Ole Miss WBB", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=wbball", group="University"),
+    Source(name="Ole Miss Baseball", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=baseball", group="University"),
+    Source(name="Ole Miss Softball", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=softball", group="University"),
+    Source(name="Ole Miss Track", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=track", group="University"),
+    Source(name="Ole Miss Soccer", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=soccer", group="University"),
+    Source(name="Ole Miss Volleyball", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=volleyball", group="University"),
+    Source(name="Ole Miss Tennis", type="ics", url="https://olemisssports.com/calendar.ashx/calendar.ics?path=tennis", group="University"),
     # Ole Miss Events
-    {"name": "Ole Miss Events", "type": "rss", "url": "https://eventcalendar.olemiss.edu/calendar.xml", "group": "University"},
+    Source(name="Ole Miss Events", type="rss", url="https://eventcalendar.olemiss.edu/calendar.xml", group="University"),
     # Community
-    {"name": "Visit Oxford", "type": "html", "url": "https://visitoxfordms.com/events/", "parser": "simple_list", "group": "Community"},
-    {"name": "SeatGeek", "type": "api", "parser": "seatgeek", "city": "Oxford", "state": "MS", "group": "Community"},
-    {"name": "Ticketmaster", "type": "api", "parser": "ticketmaster", "city": "Oxford", "stateCode": "MS", "group": "Community"},
-]
+    Source(name="Visit Oxford", type="html", url="https://visitoxfordms.com/events/", parser="simple_list", group="Community"),
+    Source(name="SeatGeek", type="api", parser="seatgeek", city="Oxford", state="MS", group="Community"),
+    Source(name="Ticketmaster", type="api", parser="ticketmaster", city="Oxford", stateCode="MS", group="Community"),
+)
+_NUM_SOURCES = len(EVENT_SOURCES)
 
 
-@st.cache_data(ttl=7200)
+# cache_resource hands every session the same object (no per-session pickle copy); the
+# script module is re-executed on each rerun, so a module-level cache wouldn't survive.
+# Callers must treat the result as read-only.
+@st.cache_resource(ttl=7200)
 def load_events():
-    """Load and cache events"""
+    """
+    Load and cache events, indexed by category so filter changes don't rescan every event
+    Returns {"events": [...], "by_category": {category: [...]}, "categories": [...]}
+    """
     # Simplified to always return mock data for now
     from datetime import date, timedelta
     today = date.today()
-    return [
+    events = [
         {
             "title": "Ole Miss Football vs Alabama",
             "start_iso": (today + timedelta(days=7)).isoformat(),
@@ -111,6 +134,23 @@ def load_events():
             "description": "Live concert featuring local and touring artists."
         }
     ]
+    
+    by_category = defaultdict(list)
+    for e in events:
+        # Same test as lib.aggregator.get_event_stats, done once here instead of every render
+        e["is_free"] = "Free" in (e.get("cost") or "")
+        # Parse the start once here; date filters and cards read these instead of re-parsing
+        try:
+            e["_start_dt"] = dtp.parse(e["start_iso"]) if e.get("start_iso") else None
+        except (ValueError, OverflowError):
+            e["_start_dt"] = None
+        e["_start_date"] = e["_start_dt"].date() if e["_start_dt"] else None
+        by_category[e.get("category")].append(e)
+    return {
+        "events": events,
+        "by_category": dict(by_category),
+        "categories": sorted(category for category in by_category if category),
+    }
 
 
 # Header (Bandsintown style)
@@ -122,7 +162,8 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load events
-events = load_events()
+data = load_events()
+events = data["events"]
 
 # Initialize filter state
 if "category_filter" not in st.session_state:
@@ -133,63 +174,8 @@ query_params = st.query_params
 if "category_filter" in query_params:
     st.session_state["category_filter"] = query_params["category_filter"]
 
-# Get all unique categories from events
-all_categories = sorted(set([e.get("category", "Other") for e in events if e.get("category")]))
-category_options = ["All"] + all_categories
-
-# Render filter chips
-render_filter_chips(
-    category_options,
-    st.session_state.get("category_filter", "All")
-)
-
-# Apply filters
-filtered_events = apply_all_filters(
-    events,
-    date_filter="all",  # No date filtering
-    category_filter=st.session_state.get("category_filter", "All"),
-    search_term=st.session_state.get("search", "")
-)
-
-# Stats
-try:
-    from lib.aggregator import get_event_stats
-    stats = get_event_stats(filtered_events)
-except:
-    stats = {
-        "total": len(filtered_events), 
-        "free": len([e for e in filtered_events if "Free" in e.get("cost", "")]), 
-        "categories": len(set([e.get("category") for e in filtered_events if e.get("category")]))
-    }
-
-st.markdown('<div class="stats-section">', unsafe_allow_html=True)
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.markdown('<div class="stat-card">', unsafe_allow_html=True)
-    st.markdown(f'<p class="stat-number">{stats["total"]}</p>', unsafe_allow_html=True)
-    st.markdown('<p class="stat-label">Total Events</p>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-
-with col2:
-    st.markdown('<div class="stat-card">', unsafe_allow_html=True)
-    st.markdown(f'<p class="stat-number">{stats["free"]}</p>', unsafe_allow_html=True)
-    st.markdown('<p class="stat-label">Free Events</p>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-
-with col3:
-    st.markdown('<div class="stat-card">', unsafe_allow_html=True)
-    st.markdown(f'<p class="stat-number">{stats["categories"]}</p>', unsafe_allow_html=True)
-    st.markdown('<p class="stat-label">Categories</p>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-
-with col4:
-    st.markdown('<div class="stat-card">', unsafe_allow_html=True)
-    st.markdown(f'<p class="stat-number">{len(EVENT_SOURCES)}</p>', unsafe_allow_html=True)
-    st.markdown('<p class="stat-label">Sources</p>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-
-st.markdown('</div>', unsafe_allow_html=True)
+# Unique categories come pre-sorted from load_events
+category_options = ["All"] + data["categories"]
 
 # Debug panel
 with st.sidebar:
@@ -202,8 +188,11 @@ with st.sidebar:
         
         st.markdown("### URL Diagnostics (curl-like)")
         st.caption("Test any URL to see status code, headers, content-type (like curl -I)")
-        debug_url = st.text_input("Test URL", placeholder="https://example.com/image.jpg", key="debug_url")
-        if debug_url:
+        # Inside a form, so the request only runs on "Test" rather than on every rerun
+        with st.form("debug_form"):
+            debug_url = st.text_input("Test URL", placeholder="https://example.com/image.jpg", key="debug_url")
+            submitted = st.form_submit_button("Test")
+        if submitted and debug_url:
             with st.spinner("Testing URL..."):
                 diag = curl_test_url(debug_url)
                 if diag["accessible"]:
@@ -216,29 +205,94 @@ with st.sidebar:
         st.markdown("### App Diagnostics")
         if st.button("Clear Cache"):
             st.cache_data.clear()
+            load_events.clear()  # cache_resource, not covered by st.cache_data.clear()
             st.success("Cache cleared!")
         
         st.markdown("**Current State:**")
-        st.json({
-            "events_count": len(filtered_events),
-            "sources_count": len(EVENT_SOURCES),
-            "timestamp": datetime.now().isoformat(),
-            "debug_mode": st.session_state.get("debug_mode", False)
-        })
-
-# Event grid
-if filtered_events:
-    # Create 3-column grid
-    for i in range(0, len(filtered_events), 3):
-        cols = st.columns(3)
-        for j in range(3):
-            if i + j < len(filtered_events):
-                event = filtered_events[i + j]
-                with cols[j]:
-                    render_event_card(event, debug_mode=st.session_state.get("debug_mode", False))
-else:
-    st.info("No events found matching your filters.")
+        # Filled in after the events view below, once this run's filtered count is known
+        current_state_slot = st.empty()
+
+# Streamlit >= 1.37 has st.fragment (1.33-1.36: st.experimental_fragment); older versions
+# just run the view inline as part of the full script
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
+
+
+@_fragment
+def _events_view(data, category_options):
+    """
+    Filter chips, stats and event grid
+    Run as a fragment, so clicking a chip or searching reruns only this block, not the whole page.
+    """
+    events = data["events"]
+    
+    # Render filter chips
+    render_filter_chips(
+        category_options,
+        st.session_state.get("category_filter", "All")
+    )
+
+    # Apply filters; a specific category starts from its pre-built slice instead of every event
+    category_filter = st.session_state.get("category_filter", "All")
+    filtered_events = apply_all_filters(
+        events if category_filter == "All" else data["by_category"].get(category_filter, []),
+        date_filter="all",  # No date filtering
+        search_term=st.session_state.get("search", "")
+    )
+    # The sidebar can't be written from a fragment, so the debug panel reads this instead
+    st.session_state["filtered_events_count"] = len(filtered_events)
+
+    # Stats
+    try:
+        from lib.aggregator import get_event_stats
+        stats = get_event_stats(filtered_events)
+    except:
+        # Single pass over the filtered events
+        total = 0
+        free = 0
+        categories = set()
+        for e in filtered_events:
+            total += 1
+            free += e["is_free"]
+            category = e.get("category")
+            if category:
+                categories.add(category)
+        stats = {"total": total, "free": free, "categories": len(categories)}
+
+    # Stats cards, rendered as one HTML block laid out by the .stats-section grid
+    stat_cards = (
+        (stats["total"], "Total Events"),
+        (stats["free"], "Free Events"),
+        (stats["categories"], "Categories"),
+        (_NUM_SOURCES, "Sources"),
+    )
+    st.markdown(
+        '<div class="stats-section">'
+        + ''.join(
+            f'<div class="stat-card"><p class="stat-number">{number}</p><p class="stat-label">{label}</p></div>'
+            for number, label in stat_cards
+        )
+        + '</div>',
+        unsafe_allow_html=True
+    )
+
+    # Event grid: every card in one HTML block, laid out by the .event-grid CSS grid
+    if filtered_events:
+        debug_mode = st.session_state.get("debug_mode", False)
+        cards_html = render_event_grid_html(filtered_events, debug_mode=debug_mode)
+        st.markdown(f'<div class="event-grid">{cards_html}</div>', unsafe_allow_html=True)
+    else:
+        st.info("No events found matching your filters.")
+
+
+_events_view(data, category_options)
+
+current_state_slot.json({
+    "events_count": st.session_state.get("filtered_events_count", len(events)),
+    "sources_count": _NUM_SOURCES,
+    "timestamp": datetime.now().isoformat(),
+    "debug_mode": st.session_state.get("debug_mode", False)
+})
 
 # Footer
 st.markdown("---")
-st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | {len(EVENT_SOURCES)} sources")
+st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | {_NUM_SOURCES} sources")
@@ -1,5 +1,5 @@
 """Test the Ole Miss Athletics scraper"""
-from lib.olemiss_athletics_scraper import fetch_olemiss_schedule
+from lib.olemiss_athletics_scraper import fetch_all_olemiss_schedules
 
 test_urls = [
     ("Football", "https://olemisssports.com/sports/football/schedule", "football"),
@@ -11,11 +11,15 @@ print("=" * 60)
 print("Testing Ole Miss Athletics Scraper")
 print("=" * 60)
 
+# Fetch every schedule concurrently, then report them in order
+schedules = fetch_all_olemiss_schedules(
+    [(url, f"Ole Miss {name}", sport_type) for name, url, sport_type in test_urls]
+)
+
 all_events = []
-for name, url, sport_type in test_urls:
+for (name, url, sport_type), events in zip(test_urls, schedules):
     print(f"\nTesting: {name}")
     print(f"URL: {url}")
-    events = fetch_olemiss_schedule(url, f"Ole Miss {name}", sport_type)
     print(f"Found: {len(events)} events")
     
     if events:
@@ -9,6 +9,9 @@ from typing import List, Dict, Any
 
 def parse_event_date(event: dict) -> Any:
     """Parse event date, returning date object or None if parsing fails."""
+    if "_start_date" in event:
+        # Already parsed once when the events were loaded
+        return event["_start_date"]
     try:
         return dtp.parse(event.get("start_iso", "")).date()
     except:
@@ -134,7 +134,7 @@ def fetch_wikipedia_team_logo(team_name: str) -> Optional[str]:
                 response = requests.get(search_url, timeout=10, headers=headers, allow_redirects=True)
                 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = BeautifulSoup(response.content, 'lxml')
                     
                     # Look for infobox logo image
                     # Wikipedia typically has logos in infobox or main article image
@@ -219,7 +219,7 @@ def fetch_wikipedia_venue_image(venue_name: str) -> Optional[str]:
                 response = requests.get(search_url, timeout=10, headers=headers, allow_redirects=True)
                 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = BeautifulSoup(response.content, 'lxml')
                     
                     # Look for main article image or infobox image
                     infobox = soup.find('table', class_='infobox')
@@ -375,7 +375,7 @@ def fetch_bing_image(query: str, num_results: int = 5) -> Optional[str]:
         response = requests.get(bing_url, timeout=15, headers=headers)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             img_links = soup.find_all('a', class_='iusc', limit=num_results)
             
             for link in img_links:
@@ -414,7 +414,7 @@ def fetch_google_image_scrape(query: str, num_results: int = 5) -> Optional[str]
         response = requests.get(google_url, timeout=15, headers=headers)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             # Google stores images in various ways, try common patterns
             img_tags = soup.find_all('img', limit=20)
             
@@ -460,7 +460,7 @@ def fetch_brave_image(query: str, num_results: int = 5) -> Optional[str]:
         response = requests.get(brave_url, timeout=15, headers=headers)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             img_tags = soup.find_all('img', limit=20)
             
             for img in img_tags:
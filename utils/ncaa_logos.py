@@ -9,6 +9,12 @@ from pathlib import Path
 from typing import Optional, List
 import re
 
+try:
+    # orjson parses the team mapping file several times faster when it's installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Local cache directory
 CACHE_DIR = Path("static/images/ncaa-logos")
 MAPPING_FILE = Path("data/ncaa_team_mappings.json")
@@ -16,6 +22,13 @@ MAPPING_FILE = Path("data/ncaa_team_mappings.json")
 # In-memory cache for mappings
 _team_mappings: Optional[dict] = None
 
+# Name cleanup patterns, compiled once (case-insensitivity inlined with (?i))
+_PREFIX_RE = re.compile(r'(?i)^(university of|univ\.? of|u\.? of)\s+')
+_THE_RE = re.compile(r'(?i)^the\s+')
+_SUFFIX_RE = re.compile(r'(?i)\s+(university|univ\.?)$')
+_PAREN_RE = re.compile(r'\s+\([^)]+\)$')
+_CLUB_RE = re.compile(r'(?i)\s+(club|team)$')
+
 
 def load_mappings() -> dict:
     """Load team name mappings from JSON file"""
@@ -27,8 +40,7 @@ def load_mappings() -> dict:
         return {}
     
     try:
-        with open(MAPPING_FILE, 'r', encoding='utf-8') as f:
-            _team_mappings = json.load(f)
+        _team_mappings = _json_loads(MAPPING_FILE.read_bytes())
         return _team_mappings
     except Exception as e:
         print(f"[ncaa_logos] Error loading mappings: {e}")
@@ -44,13 +56,13 @@ def normalize_team_name(name: str) -> str:
         return ""
     
     # Remove common prefixes
-    name = re.sub(r'^(university of|univ\.? of|u\.? of)\s+', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'^(the\s+)', '', name, flags=re.IGNORECASE)
+    name = _PREFIX_RE.sub('', name)
+    name = _THE_RE.sub('', name)
     
     # Remove common suffixes
-    name = re.sub(r'\s+(university|univ\.?)$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s+\([^)]+\)$', '', name)  # Remove parenthetical info like "(D2)"
-    name = re.sub(r'\s+(club|team)$', '', name, flags=re.IGNORECASE)  # Remove "Club" or "Team"
+    name = _SUFFIX_RE.sub('', name)
+    name = _PAREN_RE.sub('', name)  # Remove parenthetical info like "(D2)"
+    name = _CLUB_RE.sub('', name)  # Remove "Club" or "Team"
     
     # Clean up whitespace
     name = ' '.join(name.split())
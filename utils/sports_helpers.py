@@ -144,14 +144,15 @@ TEAM_ALIASES = {
 }
 
 
+# Runs of anything other than letters, digits and "&" (whitespace included) collapse to one space
+_NON_NAME_RUN_RE = re.compile(r'[^a-z0-9&]+')
+
+
 def normalize_team_name(name: str) -> str:
     """Normalize team name for lookup"""
     if not name:
         return ''
-    normalized = name.lower().strip()
-    normalized = re.sub(r'[^a-z0-9& ]', ' ', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-    return normalized
+    return _NON_NAME_RUN_RE.sub(' ', name.lower()).strip()
 
 
 def get_team_logo_url(team_name: str) -> Optional[str]:
@@ -195,37 +196,39 @@ def is_sports_event(event: dict) -> bool:
     return 'ole miss' in title_desc and (' vs' in title_desc or ' at ' in title_desc or ' versus' in title_desc)
 
 
+# Patterns to match: "Team vs Ole Miss", "Team at Ole Miss", "Ole Miss vs Team", etc.
+_OPPONENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:^|\s)([A-Za-z0-9&.\'\-\s]+?)\s+(?:vs\.?|vs|versus)\s+(?:Ole Miss|University of Mississippi|Rebels)',
+    r'(?:Ole Miss|University of Mississippi|Rebels)\s+(?:vs\.?|vs|versus)\s+([A-Za-z0-9&.\'\-\s]+?)(?:\s|$)',
+    r'([A-Za-z0-9&.\'\-\s]+?)\s+at\s+(?:Ole Miss|University of Mississippi|The Pavilion|Vaught[- ]Hemingway)',
+    r'host(?:ing)?\s+(?:the\s+)?([A-Za-z0-9&.\'\-\s]+?)(?:\s|$)',
+    r'welcomes?\s+(?:the\s+)?([A-Za-z0-9&.\'\-\s]+?)(?:\s|$)',
+))
+_TRAILING_MATCHUP_RE = re.compile(r'\s+(?:vs\.?|vs|versus|at)\s+.*$', re.IGNORECASE)
+_LEADING_THE_RE = re.compile(r'^(?:the\s+)?', re.IGNORECASE)
+_OPPONENT_BLACKLIST = frozenset(['ole miss', 'rebels', 'university of mississippi', 'mississippi', 'the', 'at', 'vs', 'versus'])
+
+
 def get_opponent_from_event(event: dict) -> Optional[str]:
     """Extract opponent name from event title/description for Ole Miss home games"""
     title = event.get('title', '')
     description = event.get('description', '')
     haystack = f"{title} {description}"
     
-    # Patterns to match: "Team vs Ole Miss", "Team at Ole Miss", "Ole Miss vs Team", etc.
-    patterns = [
-        r'(?:^|\s)([A-Za-z0-9&.\'\-\s]+?)\s+(?:vs\.?|vs|versus)\s+(?:Ole Miss|University of Mississippi|Rebels)',
-        r'(?:Ole Miss|University of Mississippi|Rebels)\s+(?:vs\.?|vs|versus)\s+([A-Za-z0-9&.\'\-\s]+?)(?:\s|$)',
-        r'([A-Za-z0-9&.\'\-\s]+?)\s+at\s+(?:Ole Miss|University of Mississippi|The Pavilion|Vaught[- ]Hemingway)',
-        r'host(?:ing)?\s+(?:the\s+)?([A-Za-z0-9&.\'\-\s]+?)(?:\s|$)',
-        r'welcomes?\s+(?:the\s+)?([A-Za-z0-9&.\'\-\s]+?)(?:\s|$)',
-    ]
-    
-    blacklisted = ['ole miss', 'rebels', 'university of mississippi', 'mississippi', 'the', 'at', 'vs', 'versus']
-    
-    for pattern in patterns:
-        match = re.search(pattern, haystack, re.IGNORECASE)
+    for pattern in _OPPONENT_PATTERNS:
+        match = pattern.search(haystack)
         if match and match.group(1):
             opponent = match.group(1).strip()
             # Clean up
-            opponent = re.sub(r'\s+(?:vs\.?|vs|versus|at)\s+.*$', '', opponent, flags=re.IGNORECASE)
-            opponent = re.sub(r'^(?:the\s+)?', '', opponent, flags=re.IGNORECASE)
+            opponent = _TRAILING_MATCHUP_RE.sub('', opponent)
+            opponent = _LEADING_THE_RE.sub('', opponent)
             opponent = opponent.strip()
             
             # Title case
             opponent = ' '.join(word.capitalize() for word in opponent.split())
             
             # Check if valid (not blacklisted)
-            if opponent and opponent.lower() not in blacklisted and len(opponent) > 2:
+            if opponent and opponent.lower() not in _OPPONENT_BLACKLIST and len(opponent) > 2:
                 return opponent
     
     return None
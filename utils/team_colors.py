@@ -15,6 +15,14 @@ LOGOS_CSV_PATH = Path("backend/assets/logos.csv")
 # In-memory cache for team colors
 _team_colors_cache: Optional[Dict[str, Tuple[str, str]]] = None
 
+# Name cleanup patterns, compiled once (case-insensitivity inlined with (?i))
+_PREFIX_RE = re.compile(r'(?i)^(university of|univ\.? of|u\.? of)\s+')
+_THE_RE = re.compile(r'(?i)^the\s+')
+_SUFFIX_RE = re.compile(r'(?i)\s+(university|univ\.?)$')
+_PAREN_RE = re.compile(r'\s+\([^)]+\)$')
+_CLUB_RE = re.compile(r'(?i)\s+(club|team)$')
+_UNIVERSITY_OF_RE = re.compile(r'(?i)university of\s+')
+
 
 @lru_cache(maxsize=1)
 def load_team_colors() -> Dict[str, Tuple[str, str]]:
@@ -70,7 +78,7 @@ def load_team_colors() -> Dict[str, Tuple[str, str]]:
             
             # Add variations without "University of"
             if "university of" in school_lower:
-                short_name = re.sub(r'university of\s+', '', school_lower).strip()
+                short_name = _UNIVERSITY_OF_RE.sub('', school_lower).strip()
                 colors[short_name] = (primary_color, alt_color)
             
             # Add variations with "University of"
@@ -105,13 +113,13 @@ def normalize_team_name_for_color(name: str) -> str:
         return ""
     
     # Remove common prefixes
-    name = re.sub(r'^(university of|univ\.? of|u\.? of)\s+', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'^(the\s+)', '', name, flags=re.IGNORECASE)
+    name = _PREFIX_RE.sub('', name)
+    name = _THE_RE.sub('', name)
     
     # Remove common suffixes
-    name = re.sub(r'\s+(university|univ\.?)$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s+\([^)]+\)$', '', name)  # Remove parenthetical info
-    name = re.sub(r'\s+(club|team)$', '', name, flags=re.IGNORECASE)
+    name = _SUFFIX_RE.sub('', name)
+    name = _PAREN_RE.sub('', name)  # Remove parenthetical info
+    name = _CLUB_RE.sub('', name)
     
     # Clean up whitespace
     name = ' '.join(name.split())